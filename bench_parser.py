@@ -0,0 +1,113 @@
+# Parsing benchmark: lxml single-pass parser vs the original BeautifulSoup parser
+# Usage: python bench_parser.py saved_pages/ [--repeat 5]
+# Point it at a folder of saved detail pages (*.html / *.htm); results pages
+# containing an rgMasterTable are benchmarked separately.
+# Install dependencies: pip install beautifulsoup4 lxml
+
+from bs4 import BeautifulSoup
+from pathlib import Path
+import argparse
+import time
+import re
+
+from detail_parser import DETAIL_SECTION_IDS, parse_detail_sections, parse_grid_rows
+
+
+# ==================== ORIGINAL IMPLEMENTATION ====================
+
+def legacy_parse_detail_sections(html):
+    """The pre-lxml extraction: full html.parser tree, per-call regex."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    def get_div_content(div_id):
+        div = soup.find("div", {"id": div_id})
+        if div:
+            return div.get_text(strip=True)
+        return ""
+
+    da_number = ""
+    match = re.search(r'(PCD\d+/\d+|RA\d+/\d+|RS\d+/\d+|DA\d+/\d+|MA\d+/\d+)', html)
+    if match:
+        da_number = match.group(1)
+
+    return {div_id: get_div_content(div_id) for div_id in DETAIL_SECTION_IDS}, da_number
+
+
+def legacy_parse_grid_rows(html):
+    """The pre-lxml grid walk from collect_da_and_urls."""
+    soup = BeautifulSoup(html, "html.parser")
+    table = soup.find("table", {"class": re.compile("rgMasterTable")})
+    if not table:
+        return None
+
+    rows = []
+    for row in table.find_all("tr")[1:]:
+        cells = row.find_all("td")
+        show_img = row.find("img", {"src": re.compile(r"GridShowButton\.png")})
+        if not show_img or len(cells) < 2:
+            continue
+        a = row.find("a")
+        href = (a.get("href") or "").strip() if a else ""
+        if not href or href.lower().startswith("javascript:"):
+            continue
+        rows.append((cells[1].get_text(strip=True), href))
+    return rows
+
+
+# ==================== BENCHMARK ====================
+
+def time_parser(parse, pages, repeat):
+    """Best-of-`repeat` pages/second for parse() over all pages."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for html in pages:
+            parse(html)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(pages) / best if best else float("inf")
+
+
+def report(title, pages, legacy, fast, repeat):
+    if not pages:
+        return
+
+    mismatches = sum(1 for html in pages if legacy(html) != fast(html))
+    legacy_rate = time_parser(legacy, pages, repeat)
+    fast_rate = time_parser(fast, pages, repeat)
+
+    print(f"\n{title} ({len(pages)} pages, best of {repeat})")
+    print(f"   BeautifulSoup (html.parser): {legacy_rate:10.1f} pages/s")
+    print(f"   lxml single-pass:            {fast_rate:10.1f} pages/s")
+    print(f"   Speedup:                     {fast_rate / legacy_rate:10.1f}x")
+    print(f"   Output mismatches:           {mismatches}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark detail/grid page parsers")
+    parser.add_argument("pages_dir", help="folder of saved detail/results pages")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    files = sorted(
+        path for path in Path(args.pages_dir).rglob("*")
+        if path.suffix.lower() in (".html", ".htm")
+    )
+    if not files:
+        print(f"❌ No .html files found in {args.pages_dir}")
+        return
+
+    pages = [path.read_text(encoding="utf-8", errors="replace") for path in files]
+    grid_pages = [html for html in pages if "rgMasterTable" in html]
+    detail_pages = [html for html in pages if "rgMasterTable" not in html]
+
+    print("=" * 70)
+    print("📊 PARSER BENCHMARK")
+    print("=" * 70)
+    report("Detail pages", detail_pages, legacy_parse_detail_sections, parse_detail_sections, args.repeat)
+    report("Results grid pages", grid_pages, legacy_parse_grid_rows, parse_grid_rows, args.repeat)
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
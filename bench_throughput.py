@@ -0,0 +1,152 @@
+# End-to-end throughput benchmark against the local MasterView stand-in
+# Drives the scraper pipeline (steps 1-7) at fake_masterview.py and reports
+# records/sec, p50/p99 per-record latency and peak RSS.
+# Usage: python bench_throughput.py --das 10000 --engine async --latency 0.05
+
+from urllib.parse import parse_qs, urlsplit
+import argparse
+import os
+import tempfile
+import time
+
+import shoalhaven_da_scraper as scraper
+from fake_masterview import APP_PATH, FakeMasterView
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def peak_rss_mb():
+    """(this process, largest child process e.g. Chrome) peak RSS in MB, if available."""
+    try:
+        import resource
+    except ImportError:
+        return None, None
+    scale = 1024 if os.uname().sysname != "Darwin" else 1024 * 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale
+    return own, children
+
+
+def point_scraper_at(root, args, output_csv):
+    """Redirect the scraper's configuration to the fake site for this run."""
+    scraper.BASE_ROOT = root
+    scraper.BASE_APP = root + APP_PATH
+    scraper.BASE_URL = root + APP_PATH + "Default.aspx"
+    scraper.START_DATE = args.start
+    scraper.END_DATE = args.end
+    scraper.OUTPUT_CSV = output_csv
+    scraper.DETAIL_ENGINE = args.engine
+    scraper.COLLECTOR = args.collector
+    scraper.DETAIL_CONCURRENCY = args.concurrency
+    scraper.MAX_REQUESTS_PER_SECOND = args.rate
+    scraper.JOB_STORE_PATH = None
+    scraper.PAGE_CACHE_DIR = None
+
+
+def run(args):
+    site = FakeMasterView(
+        das=args.das, latency=args.latency, error_rate=args.error_rate,
+        page_size=args.page_size, max_page_size=args.max_page_size,
+    )
+    root = site.start()
+    output_csv = os.path.join(tempfile.mkdtemp(prefix="bench_"), "results.csv")
+    point_scraper_at(root, args, output_csv)
+
+    latencies = []
+    writer = scraper.CsvRecordWriter(output_csv)
+
+    def on_record(item, record):
+        # Latency = first request for this key at the server -> record parsed here
+        key = parse_qs(urlsplit(item["url"]).query).get("key", [""])[0]
+        started = site.detail_requests.get(int(key)) if key.isdigit() else None
+        if started is not None:
+            latencies.append(time.perf_counter() - started)
+        writer.write(record)
+
+    driver = scraper.create_driver(headless=not args.show_browser, profile="bench")
+    try:
+        search_start = time.perf_counter()
+        if args.pipeline:
+            # Grid paging happens inside scrape_pipelined, overlapped with detail fetches
+            opened = scraper.open_search(driver, args.start, args.end)
+            search = (*opened, None) if opened else None
+        else:
+            search = scraper.run_search(driver, args.start, args.end)
+        search_seconds = time.perf_counter() - search_start
+        if search is None:
+            print("❌ Search failed against the fake site")
+            return
+        total_items, total_pages, da_url_list = search
+
+        scrape_start = time.perf_counter()
+        with writer:
+            if args.pipeline:
+                collected = scraper.scrape_pipelined(driver, total_items, total_pages, on_record=on_record)
+            else:
+                scraper.scrape_all_records(driver, da_url_list, on_record=on_record, keep_records=False)
+                collected = len(da_url_list)
+        scrape_seconds = time.perf_counter() - scrape_start
+    finally:
+        writer.close()
+        driver.quit()
+        site.stop()
+
+    own_rss, child_rss = peak_rss_mb()
+    total_seconds = search_seconds + scrape_seconds
+
+    print("\n" + "=" * 70)
+    print("📊 THROUGHPUT BENCHMARK")
+    print("=" * 70)
+    mode = "pipelined (http)" if args.pipeline else f"{args.engine} / {args.collector}"
+    print(f"   Engine / collector:   {mode}")
+    print(f"   Synthetic DAs:        {args.das} (in range: {total_items}, pages: {total_pages})")
+    print(f"   Injected latency:     {args.latency * 1000:.0f} ms | error rate: {args.error_rate:.1%}")
+    print(f"   Records written:      {writer.count}/{collected}")
+    if args.pipeline:
+        print(f"   Search:               {search_seconds:.2f} s")
+        print(f"   Collection + detail:  {scrape_seconds:.2f} s")
+    else:
+        print(f"   Search + collection:  {search_seconds:.2f} s")
+        print(f"   Detail scraping:      {scrape_seconds:.2f} s")
+    if scrape_seconds:
+        print(f"   Records/sec (detail): {writer.count / scrape_seconds:.1f}")
+    if total_seconds:
+        print(f"   Records/sec (total):  {writer.count / total_seconds:.1f}")
+    print(f"   Latency p50 / p99:    {percentile(latencies, 50) * 1000:.0f} ms / "
+          f"{percentile(latencies, 99) * 1000:.0f} ms")
+    if own_rss is not None:
+        print(f"   Peak RSS:             {own_rss:.0f} MB (python), {child_rss:.0f} MB (largest child)")
+    print(f"   Server requests:      {site.request_count} ({site.error_count} injected errors)")
+    print("=" * 70)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end scraper benchmark against a local fake site")
+    parser.add_argument("--das", type=int, default=10000, help="synthetic DAs on the fake site")
+    parser.add_argument("--start", default="01/09/2025")
+    parser.add_argument("--end", default="30/09/2025")
+    # The pool engine's spawned workers re-import the scraper with its real
+    # BASE_URL, so only in-process engines can be pointed at the fake site
+    parser.add_argument("--engine", default="http", choices=["selenium", "http", "async", "tabs"])
+    parser.add_argument("--collector", default="browser", choices=["browser", "postback"])
+    parser.add_argument("--pipeline", action="store_true",
+                        help="overlap grid collection with HTTP detail fetches (ignores --engine/--collector)")
+    parser.add_argument("--concurrency", type=int, default=scraper.DETAIL_CONCURRENCY)
+    parser.add_argument("--rate", type=float, default=1000.0, help="requests/sec cap per host")
+    parser.add_argument("--latency", type=float, default=0.0, help="mean injected seconds per response")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--max-page-size", type=int, default=250)
+    parser.add_argument("--show-browser", action="store_true")
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
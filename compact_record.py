@@ -0,0 +1,110 @@
+# Compact in-memory DA records
+# A CompactRecord keeps one DA's fields in slots instead of a 13-key dict.
+# Fields whose values repeat across DAs (dates, decisions, categories, empty
+# progress tables, the contact text) are interned, and detail URLs are stored as
+# an interned prefix plus integer key/propkey. It reads like the dict it
+# replaces (a Mapping in HEADERS order); expand() gives the plain dict.
+
+from collections.abc import Mapping
+import re
+import sys
+
+
+FIELDS = (
+    "DA_Number", "Detail_URL", "Description", "Submitted_Date", "Decision", "Categories",
+    "Property_Address", "Applicant", "Progress", "Fees", "Documents", "Contact_Council",
+)
+DOCUMENT_LINKS = "Document_Links"   # extra (non-CSV) key, present when the page had links
+
+# Fields whose values repeat across DAs: one shared string per value.
+# Applicant and Fees are close to unique per DA apart from "Not required"
+# (112 and 96 distinct values in the 215-row sample results.csv), so
+# interning them would only grow the intern table.
+INTERNED_FIELDS = frozenset({
+    "Submitted_Date", "Decision", "Categories", "Progress", "Contact_Council",
+})
+# ...default.aspx?page=wrapper&key=732614[&propkey=78731]
+DETAIL_URL_RE = re.compile(r"^(.*[?&]key=)([1-9]\d*)(?:&propkey=([1-9]\d*))?$")
+
+_SLOT_FIELDS = tuple(field for field in FIELDS if field != "Detail_URL")
+_FIELD_SET = frozenset(FIELDS)
+
+
+class CompactRecord(Mapping):
+    """
+    Slotted record. Supports record[field], .get(), iteration, dict(record)
+    and assignment to known fields, like the dict it replaces. Pickles as its
+    slots, so it also stays small between pool processes.
+    """
+
+    __slots__ = _SLOT_FIELDS + ("_url_prefix", "_key", "_propkey", "_documents")
+
+    def __init__(self, record=()):
+        for field in _SLOT_FIELDS:
+            setattr(self, field, "")
+        self._url_prefix = ""
+        self._key = None
+        self._propkey = None
+        self._documents = None
+        for field, value in dict(record).items():
+            self[field] = value
+
+    @classmethod
+    def from_dict(cls, record):
+        return record if isinstance(record, cls) else cls(record)
+
+    # ---------- mapping interface ----------
+
+    def __getitem__(self, field):
+        if field == "Detail_URL":
+            return self._detail_url()
+        if field == DOCUMENT_LINKS and self._documents is not None:
+            return self._documents
+        if field in _FIELD_SET:
+            return getattr(self, field)
+        raise KeyError(field)
+
+    def __setitem__(self, field, value):
+        if field == "Detail_URL":
+            self._set_detail_url(value or "")
+        elif field == DOCUMENT_LINKS:
+            self._documents = value or None
+        elif field in _FIELD_SET:
+            # str() also drops str subclasses (e.g. lxml results holding their tree)
+            value = str(value or "")
+            setattr(self, field, sys.intern(value) if field in INTERNED_FIELDS else value)
+        else:
+            raise KeyError(field)
+
+    def __iter__(self):
+        yield from FIELDS
+        if self._documents is not None:
+            yield DOCUMENT_LINKS
+
+    def __len__(self):
+        return len(FIELDS) + (self._documents is not None)
+
+    def __repr__(self):
+        return f"CompactRecord({self.expand()!r})"
+
+    def expand(self):
+        """Plain dict in HEADERS order (plus Document_Links), for output."""
+        return dict(self.items())
+
+    # ---------- detail URL ----------
+
+    def _detail_url(self):
+        if self._key is None:
+            return self._url_prefix
+        url = f"{self._url_prefix}{self._key}"
+        return url if self._propkey is None else f"{url}&propkey={self._propkey}"
+
+    def _set_detail_url(self, url):
+        match = DETAIL_URL_RE.match(url)
+        if match is None:
+            self._url_prefix, self._key, self._propkey = url, None, None
+            return
+        prefix, key, propkey = match.groups()
+        self._url_prefix = sys.intern(prefix)
+        self._key = int(key)
+        self._propkey = int(propkey) if propkey else None
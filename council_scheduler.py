@@ -0,0 +1,202 @@
+# Multi-council MasterView scheduler
+# Site profiles (base URL, DA-number regex, section IDs, rate budget) come from a
+# JSON config. Each council gets its own worker process, which works through that
+# site's queue of date windows one at a time, so every site keeps its own budget.
+# Usage: python council_scheduler.py --config councils.json --start 01/09/2025 --end 30/09/2025
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stderr, redirect_stdout
+import argparse
+import json
+import multiprocessing as mp
+import os
+import re
+import time
+
+import detail_parser
+import shoalhaven_da_scraper as scraper
+from run_metrics import RunMetrics
+
+
+REQUIRED_KEYS = ("name", "base_root", "app_path", "da_regex")
+
+# Settings as imported, restored before each profile is applied so nothing
+# leaks from one council to the next
+SCRAPER_DEFAULTS = {name: value for name, value in vars(scraper).items() if name.isupper()}
+PARSER_DEFAULTS = {"DA_NUMBER_RE": detail_parser.DA_NUMBER_RE}
+
+
+def load_profiles(path):
+    """Council profiles from a JSON config, each merged over its "defaults"."""
+    with open(path, encoding="utf-8") as f:
+        config = json.load(f)
+
+    defaults = config.get("defaults", {})
+    profiles = []
+    for council in config.get("councils", []):
+        profile = dict(defaults)
+        profile.update(council)
+        missing = [key for key in REQUIRED_KEYS if not profile.get(key)]
+        if missing:
+            raise ValueError(f"Council profile {council.get('name', '?')!r} is missing {', '.join(missing)}")
+        # Fail before any browser starts; the DA number is the first group
+        if re.compile(profile["da_regex"]).groups < 1:
+            raise ValueError(f"Council profile {profile['name']!r}: da_regex needs a capture group")
+        profiles.append(profile)
+    return profiles
+
+
+def apply_profile(profile, out_dir):
+    """
+    Point the scraper (in this process) at one council. Returns the council's
+    output directory, which also holds its job store and log.
+    """
+    name = profile["name"]
+    site_dir = os.path.join(out_dir, name)
+    os.makedirs(site_dir, exist_ok=True)
+
+    for setting, value in SCRAPER_DEFAULTS.items():
+        setattr(scraper, setting, value)
+    for setting, value in PARSER_DEFAULTS.items():
+        setattr(detail_parser, setting, value)
+
+    root = profile["base_root"].rstrip("/")
+    app = root + "/" + profile["app_path"].strip("/") + "/"
+    scraper.BASE_ROOT = root
+    scraper.BASE_APP = app
+    scraper.BASE_URL = app + "Default.aspx"
+    scraper.TRACKING_LINK_TEXT = profile.get("tracking_link_text", scraper.TRACKING_LINK_TEXT)
+    if profile.get("fees_no_fees_text"):
+        scraper.FEES_NO_FEES_TEXT = profile["fees_no_fees_text"]
+    if profile.get("contact_no_exhibition_text"):
+        scraper.CONTACT_NO_EXHIBITION_TEXT = profile["contact_no_exhibition_text"]
+
+    # Per-site rate budget: this process is the only one talking to the site
+    scraper.MAX_REQUESTS_PER_SECOND = float(profile.get("rate", scraper.MAX_REQUESTS_PER_SECOND))
+    scraper.DETAIL_CONCURRENCY = int(profile.get("concurrency", scraper.DETAIL_CONCURRENCY))
+
+    # Pool workers and backfill windows start fresh interpreters that would
+    # not see this profile, so the site's windows run in-process instead
+    engine = profile.get("engine", scraper.DETAIL_ENGINE)
+    if engine == "pool":
+        print(f"⚠️  {name}: pool engine is not available under the scheduler, using http")
+        engine = "http"
+    scraper.DETAIL_ENGINE = engine
+    scraper.BACKFILL_WINDOW = None
+
+    scraper.JOB_STORE_PATH = os.path.join(site_dir, "scrape_jobs.sqlite")
+    if scraper.CHROME_PROFILE_DIR:
+        scraper.CHROME_PROFILE_DIR = os.path.join(scraper.CHROME_PROFILE_DIR, name)
+
+    detail_parser.DA_NUMBER_RE = re.compile(profile["da_regex"])
+    detail_parser.SECTION_ALIASES.clear()
+    detail_parser.SECTION_ALIASES.update(profile.get("section_aliases") or {})
+
+    # Any other scraper setting, e.g. {"PAGE_CACHE_DIR": "cache/kiama"}
+    for setting, value in (profile.get("settings") or {}).items():
+        if not setting.isupper() or not hasattr(scraper, setting):
+            raise ValueError(f"{name}: unknown scraper setting {setting!r}")
+        setattr(scraper, setting, value)
+
+    return site_dir
+
+
+def run_site(profile, windows, out_dir):
+    """
+    Worker process: scrape every window for one council, in order.
+    Output goes to <out_dir>/<name>/; the full log to <name>/scrape.log.
+    """
+    site_dir = apply_profile(profile, out_dir)
+    results = []
+
+    with open(os.path.join(site_dir, "scrape.log"), "a", encoding="utf-8") as log, \
+            redirect_stdout(log), redirect_stderr(log):
+        for start_date, end_date in windows:
+            tag = f"{start_date}_{end_date}".replace("/", "-")
+            scraper.START_DATE, scraper.END_DATE = start_date, end_date
+            scraper.OUTPUT_CSV = os.path.join(site_dir, f"results_{tag}.csv")
+            scraper.METRICS_JSON = os.path.join(site_dir, f"run_metrics_{tag}.json")
+            scraper.METRICS_PROM = os.path.join(site_dir, f"run_metrics_{tag}.prom")
+            scraper.metrics = RunMetrics()
+
+            started = time.perf_counter()
+            scraper.main()
+            log.flush()
+            # Judged by what this run wrote: the CSV may be left over from an
+            # earlier run, or hold only the header row
+            counters = scraper.metrics.counters
+            written = counters.get("records_written", 0)
+            results.append({
+                "window": (start_date, end_date),
+                "output": scraper.OUTPUT_CSV if written else None,
+                "records": written,
+                "failed": counters.get("records_failed", 0) + counters.get("records_empty", 0),
+                "seconds": time.perf_counter() - started,
+            })
+
+    return profile["name"], results
+
+
+def schedule(profiles, windows, workers, out_dir):
+    """Run every council concurrently (at most `workers` at once)."""
+    workers = max(1, min(workers, len(profiles)))
+    print("\n" + "=" * 70)
+    print(f"🏛️  {len(profiles)} councils × {len(windows)} windows, {workers} parallel sites")
+    print("=" * 70)
+
+    failed = []
+    # A fresh process per council: the scraper is configured through module globals
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn"),
+                             max_tasks_per_child=1) as pool:
+        futures = {pool.submit(run_site, profile, windows, out_dir): profile["name"] for profile in profiles}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                _, results = future.result()
+            except Exception as e:
+                failed.append(name)
+                print(f"❌ {name}: {type(e).__name__}: {e}")
+                continue
+
+            for result in results:
+                start_date, end_date = result["window"]
+                status = "❌" if not result["output"] else "⚠️ " if result["failed"] else "✅"
+                print(f"{status} {name:<20} {start_date} → {end_date}: "
+                      f"{result['records']} records, {result['failed']} failed in {result['seconds']:.0f}s")
+                if not result["output"]:
+                    failed.append(name)
+
+    print("=" * 70)
+    print(f"Logs and results: {out_dir}/<council>/")
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape several MasterView councils concurrently")
+    parser.add_argument("--config", default="councils.json")
+    parser.add_argument("--start", default=scraper.START_DATE)
+    parser.add_argument("--end", default=scraper.END_DATE)
+    parser.add_argument("--window", help='split the range per site: "week", "month" or a number of days')
+    parser.add_argument("--workers", type=int, default=4, help="councils scraped at the same time")
+    parser.add_argument("--only", nargs="+", help="council names to run")
+    parser.add_argument("--out-dir", default="councils")
+    args = parser.parse_args()
+
+    profiles = load_profiles(args.config)
+    if args.only:
+        profiles = [profile for profile in profiles if profile["name"] in args.only]
+    if not profiles:
+        print("❌ No councils selected")
+        return
+
+    if args.window:
+        window = int(args.window) if args.window.isdigit() else args.window
+        windows = scraper.split_date_range(args.start, args.end, window)
+    else:
+        windows = [(args.start, args.end)]
+
+    schedule(profiles, windows, args.workers, args.out_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+# Single-pass lxml parsers for MasterView detail and results pages
+# Each page is parsed once; only the lbl* section divs and grid rows are visited
+# Install dependencies: pip install lxml
+
+from urllib.parse import parse_qs, urljoin, urlsplit
+import lxml.html
+import re
+
+
+# Detail sections (div IDs) in the order they appear in the CSV
+DETAIL_SECTION_IDS = [
+    "lblDetails", "lblDecision", "lblCat", "lblProp", "lblPeople",
+    "lblProg", "lblFees", "lblDocs", "lbl91",
+]
+DOCUMENTS_SECTION_ID = "lblDocs"
+
+# Site div ID -> canonical ID above, for MasterView sites whose detail
+# sections use other IDs (set from a council profile)
+SECTION_ALIASES = {}
+
+DA_NUMBER_RE = re.compile(r"(PCD\d+/\d+|RA\d+/\d+|RS\d+/\d+|DA\d+/\d+|MA\d+/\d+)")
+SHOW_BUTTON_RE = re.compile(r"GridShowButton\.png")
+INFO_PART_RE = re.compile(r"rgWrap.*rgInfoPart")
+POSTBACK_TARGET_RE = re.compile(r"__doPostBack\('([^']+)'")
+
+# Text inside these elements is not page text (matches BeautifulSoup.get_text)
+_NON_TEXT_TAGS = {"script", "style", "template"}
+_NON_FIELD_INPUTS = {"submit", "button", "image", "reset", "file"}
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+
+# ==================== HELPERS ====================
+
+def parse_html(html):
+    """Parse a page once. Encoding to bytes lets lxml accept XML declarations."""
+    if isinstance(html, str):
+        html = html.encode("utf-8")
+    return lxml.html.fromstring(html, parser=_HTML_PARSER)
+
+
+def stripped_text(element):
+    """
+    Equivalent of BeautifulSoup's get_text(strip=True): every text node
+    stripped and concatenated, skipping comments, scripts and styles.
+    """
+    parts = []
+
+    def add(text):
+        if text:
+            text = text.strip()
+            if text:
+                parts.append(text)
+
+    def walk(node):
+        if not isinstance(node.tag, str) or node.tag.lower() in _NON_TEXT_TAGS:
+            return
+        add(node.text)
+        for child in node:
+            walk(child)
+            add(child.tail)
+
+    walk(element)
+    return "".join(parts)
+
+
+def _has_class(element, pattern):
+    return bool(pattern.search(element.get("class") or ""))
+
+
+# ==================== DETAIL PAGES ====================
+
+def _document_links(div, base_url):
+    """[{'url', 'title', 'doc_id'}] for every link in the lblDocs section."""
+    documents = []
+    for link in div.iter("a"):
+        href = (link.get("href") or "").strip()
+        if not href or href.lower().startswith("javascript:"):
+            continue
+        url = urljoin(base_url, href) if base_url else href
+        doc_id = parse_qs(urlsplit(url).query).get("id", [""])[0]
+        documents.append({"url": url, "title": stripped_text(link), "doc_id": doc_id})
+    return documents
+
+
+def _da_number(tree, sections):
+    """
+    DA number from the page heading, else from the lblDetails text, else
+    from anywhere in the page text (sites put it in different elements).
+    """
+    for heading in tree.iter("h1", "h2", "h3"):
+        match = DA_NUMBER_RE.search(stripped_text(heading))
+        if match:
+            return match.group(1)
+    # Text nodes are joined with spaces so a number never runs into the next node's digits
+    match = DA_NUMBER_RE.search(sections.get("lblDetails", "")) or DA_NUMBER_RE.search(" ".join(tree.itertext()))
+    return match.group(1) if match else ""
+
+
+def parse_detail_page(html, section_ids=None, base_url=None):
+    """
+    Single parse of a detail page returning
+    {'sections': {div_id: text}, 'da_number': str, 'documents': [...]}.
+    Missing sections map to "" so callers can index every requested ID;
+    documents are the lblDocs links (empty unless lblDocs is requested).
+    """
+    wanted = set(DETAIL_SECTION_IDS if section_ids is None else section_ids)
+    sections = {div_id: "" for div_id in wanted}
+    documents = []
+    found = set()
+
+    tree = parse_html(html)
+    for div in tree.iter("div") if wanted else ():
+        div_id = div.get("id")
+        div_id = SECTION_ALIASES.get(div_id, div_id)
+        if div_id in wanted and div_id not in found:
+            sections[div_id] = stripped_text(div)
+            if div_id == DOCUMENTS_SECTION_ID:
+                documents = _document_links(div, base_url)
+            found.add(div_id)
+            if len(found) == len(wanted):
+                break
+
+    return {
+        "sections": sections,
+        "da_number": _da_number(tree, sections),
+        "documents": documents,
+    }
+
+
+def site_section_ids(section_ids=None):
+    """The div IDs the current site uses for the given canonical section IDs."""
+    site_ids = {canonical: site_id for site_id, canonical in SECTION_ALIASES.items()}
+    section_ids = DETAIL_SECTION_IDS if section_ids is None else section_ids
+    return [site_ids.get(div_id, div_id) for div_id in section_ids]
+
+
+def parse_detail_sections(html, section_ids=None):
+    """
+    Return ({div_id: text}, da_number) for a detail page.
+    Missing sections map to "" so callers can index every requested ID.
+    """
+    page = parse_detail_page(html, section_ids)
+    return page["sections"], page["da_number"]
+
+
+# ==================== RESULTS GRID ====================
+
+def _find_master_table(tree):
+    for table in tree.iter("table"):
+        if "rgMasterTable" in (table.get("class") or ""):
+            return table
+    return None
+
+
+def _grid_header(table):
+    """Column names from the grid's header row ('' for unnamed columns)."""
+    for row in table.iter("tr"):
+        names = [stripped_text(th) for th in row.iter("th")]
+        if names:
+            return names
+    return []
+
+
+def _grid_row_cells(table):
+    """[(da, href, cells)] for every Show-button row (header row skipped)."""
+    rows = []
+    for row in list(table.iter("tr"))[1:]:
+        cells = list(row.iter("td"))
+        has_show = any(SHOW_BUTTON_RE.search(img.get("src") or "") for img in row.iter("img"))
+        if not has_show or len(cells) < 2:
+            continue
+
+        link = next(row.iter("a"), None)
+        if link is None:
+            continue
+        href = (link.get("href") or "").strip()
+
+        # Skip javascript: links (postbacks)
+        if not href or href.lower().startswith("javascript:"):
+            continue
+
+        rows.append((stripped_text(cells[1]), href, cells))
+    return rows
+
+
+def _grid_rows(table):
+    """[(da, href)] for every Show-button row (header row skipped)."""
+    return [(da, href) for da, href, _ in _grid_row_cells(table)]
+
+
+def _total_pages_and_items(tree):
+    for div in tree.iter("div"):
+        if _has_class(div, INFO_PART_RE):
+            strong = [stripped_text(tag) for tag in div.iter("strong")]
+            if len(strong) >= 2:
+                return int(strong[0]), int(strong[1])
+            return None, None
+    return None, None
+
+
+def parse_grid_rows(html):
+    """
+    Return [(da, href), ...] for the results grid, or None when the page has
+    no rgMasterTable.
+    """
+    table = _find_master_table(parse_html(html))
+    if table is None:
+        return None
+    return _grid_rows(table)
+
+
+def parse_grid_summaries(html):
+    """
+    Return [(da, href, {column: text}), ...] for the results grid, with every
+    named column keyed by its header text, or None when the page has no
+    rgMasterTable.
+    """
+    table = _find_master_table(parse_html(html))
+    if table is None:
+        return None
+    header = _grid_header(table)
+    return [
+        (da, href, {
+            name: stripped_text(cells[i])
+            for i, name in enumerate(header)
+            if name and i < len(cells)
+        })
+        for da, href, cells in _grid_row_cells(table)
+    ]
+
+
+def parse_total_pages_and_items(html):
+    """(total_items, total_pages) from the rgInfoPart div, or (None, None)."""
+    return _total_pages_and_items(parse_html(html))
+
+
+def _form_fields(form):
+    """Serialize a form's successful controls the way a browser would."""
+    fields = {}
+    for el in form.iter("input", "select", "textarea"):
+        name = el.get("name")
+        if not name or el.get("disabled") is not None:
+            continue
+
+        if el.tag == "select":
+            options = list(el.iter("option"))
+            chosen = [opt for opt in options if opt.get("selected") is not None] or options[:1]
+            if chosen:
+                fields[name] = chosen[0].get("value", stripped_text(chosen[0]))
+            else:
+                fields[name] = ""
+        elif el.tag == "textarea":
+            fields[name] = el.text or ""
+        else:
+            kind = (el.get("type") or "text").lower()
+            if kind in _NON_FIELD_INPUTS:
+                continue
+            if kind in ("checkbox", "radio") and el.get("checked") is None:
+                continue
+            fields[name] = el.get("value", "")
+    return fields
+
+
+def parse_results_page(html, base_url):
+    """
+    Everything the postback collector needs from one results page, from a
+    single parse: grid rows, totals, pager target, grid IDs and form state.
+    """
+    tree = parse_html(html)
+    table = _find_master_table(tree)
+    total_items, total_pages = _total_pages_and_items(tree)
+
+    next_target = None
+    for el in tree.iter("input"):
+        if "rgPageNext" in (el.get("class") or ""):
+            match = POSTBACK_TARGET_RE.search(el.get("onclick") or "")
+            next_target = match.group(1) if match else el.get("name")
+            break
+
+    # Client ID ctl00_cphContent_..._ctl00 -> UniqueID ctl00$cphContent$...$ctl00
+    grid_id = master_id = None
+    if table is not None and table.get("id"):
+        master_id = table.get("id").replace("_", "$")
+        grid_id = master_id.rsplit("$", 1)[0]
+
+    form = next(tree.iter("form"), None)
+    form_action = urljoin(base_url, (form.get("action") if form is not None else None) or base_url)
+
+    return {
+        "rows": _grid_rows(table) if table is not None else None,
+        "total_items": total_items,
+        "total_pages": total_pages,
+        "next_target": next_target,
+        "grid_id": grid_id,
+        "master_id": master_id,
+        "form_action": form_action,
+        "form_fields": _form_fields(form) if form is not None else {},
+    }
@@ -0,0 +1,164 @@
+# Content-addressed store for DA documents (lblDocs links)
+# Files are streamed to disk while hashing and kept once per SHA-256 under
+# store/<sha[:2]>/<sha>; manifest.jsonl maps every (DA, URL) to its content.
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import hashlib
+import json
+import os
+import re
+import threading
+
+
+CHUNK_SIZE = 64 * 1024
+FILENAME_RE = re.compile(r'filename\*?=(?:UTF-8\'\')?"?([^";]+)"?', re.IGNORECASE)
+
+
+class DocumentStore:
+    """
+    Documents under `root`:
+      store/<sha[:2]>/<sha>  - file content, one copy per distinct hash
+      manifest.jsonl         - one JSON line per downloaded (da, url)
+    URLs already in the manifest are skipped on later runs.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.manifest_path = os.path.join(root, "manifest.jsonl")
+        self._lock = threading.Lock()
+        self._urls = set()
+        self._hashes = set()
+        os.makedirs(os.path.join(root, "store"), exist_ok=True)
+        os.makedirs(os.path.join(root, "tmp"), exist_ok=True)
+
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line after a crash
+                    self._urls.add(entry["url"])
+                    self._hashes.add(entry["sha256"])
+
+    def path(self, sha256):
+        return os.path.join(self.root, "store", sha256[:2], sha256)
+
+    def has_url(self, url):
+        with self._lock:
+            return url in self._urls
+
+    def save_stream(self, chunks):
+        """
+        Write an iterable of byte chunks, hashing as it goes.
+        Returns (sha256, size, is_new); duplicate content is discarded.
+        """
+        digest = hashlib.sha256()
+        size = 0
+        tmp = os.path.join(self.root, "tmp", f"{os.getpid()}-{threading.get_ident()}.part")
+        try:
+            with open(tmp, "wb") as f:
+                for chunk in chunks:
+                    if chunk:
+                        digest.update(chunk)
+                        f.write(chunk)
+                        size += len(chunk)
+
+            sha256 = digest.hexdigest()
+            target = self.path(sha256)
+            with self._lock:
+                is_new = sha256 not in self._hashes and not os.path.exists(target)
+                if is_new:
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    os.replace(tmp, target)
+                self._hashes.add(sha256)
+            return sha256, size, is_new
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def add_entry(self, entry):
+        """Append one manifest line (flushed immediately)."""
+        with self._lock:
+            with open(self.manifest_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._urls.add(entry["url"])
+
+
+class DocumentDownloader:
+    """
+    Downloads documents on a bounded thread pool sharing one pooled
+    requests.Session. submit() blocks once max_pending downloads are queued,
+    so a fast scraper cannot build an unbounded backlog.
+    """
+
+    def __init__(self, session, store, workers=4, timeout=60, max_pending=None):
+        self.session = session
+        self.store = store
+        self.timeout = timeout
+        self.downloaded = 0
+        self.duplicates = 0
+        self.skipped = 0
+        self.failed = 0
+        self.bytes = 0
+        self._counter_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_pending or workers * 4)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="docs")
+        self._queued = set()
+
+    def submit(self, da, documents):
+        """Queue every not-yet-stored document link for one DA."""
+        for document in documents:
+            url = document["url"]
+            if url in self._queued or self.store.has_url(url):
+                self._count("skipped")
+                continue
+            self._queued.add(url)
+            self._slots.acquire()
+            future = self._pool.submit(self._download, da, document)
+            future.add_done_callback(lambda _: self._slots.release())
+
+    def _count(self, name, value=1):
+        with self._counter_lock:
+            setattr(self, name, getattr(self, name) + value)
+
+    def _download(self, da, document):
+        url = document["url"]
+        try:
+            with self.session.get(url, stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
+                sha256, size, is_new = self.store.save_stream(response.iter_content(CHUNK_SIZE))
+                content_type = response.headers.get("Content-Type", "")
+                match = FILENAME_RE.search(response.headers.get("Content-Disposition", ""))
+        except Exception as e:
+            self._count("failed")
+            print(f"⚠️  Document download failed for {da}: {url} ({type(e).__name__})")
+            return
+
+        self.store.add_entry({
+            "da": da,
+            "url": url,
+            "doc_id": document.get("doc_id", ""),
+            "title": document.get("title", ""),
+            "filename": match.group(1) if match else "",
+            "content_type": content_type,
+            "size": size,
+            "sha256": sha256,
+            "path": os.path.relpath(self.store.path(sha256), self.store.root),
+            "downloaded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        })
+        self._count("downloaded")
+        self._count("bytes", size)
+        if not is_new:
+            self._count("duplicates")
+
+    def close(self):
+        """Wait for queued downloads to finish."""
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,464 @@
+# Local stand-in for the MasterView ApplicationMaster site
+# Serves the page structures the scraper relies on (disclaimer, DA Tracking,
+# Advanced Search, Telerik results grid with postback paging, detail pages)
+# over synthetic DAs, with configurable latency and error injection.
+# Usage: python fake_masterview.py --das 10000 --latency 0.05 --error-rate 0.01
+
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+import argparse
+import base64
+import html
+import json
+import random
+import threading
+import time
+
+
+APP_PATH = "/masterviewUI/modules/ApplicationMaster/"
+DISCLAIMER_COOKIE = "MVDisclaimer"
+DATE_FORMAT = "%d/%m/%Y"
+
+# Client IDs mirror the live site, so UniqueIDs follow by replacing _ with $
+SEARCH_PREFIX = "ctl00_cphContent_ctl00_"
+GRID_CLIENT_ID = "ctl00_cphContent_ctl01_ctl00_RadGrid1"
+MASTER_CLIENT_ID = GRID_CLIENT_ID + "_ctl00"
+GRID_UNIQUE_ID = GRID_CLIENT_ID.replace("_", "$")
+MASTER_UNIQUE_ID = MASTER_CLIENT_ID.replace("_", "$")
+NEXT_UNIQUE_ID = MASTER_UNIQUE_ID + "$ctl03$ctl01$ctl10"
+
+PREFIXES = ["DA", "PCD", "RA", "MA", "RS"]
+CATEGORIES = [
+    "Private Certifier Complying Development App",
+    "Development Application",
+    "Modification Application",
+    "Review Application",
+    "Subdivision Certificate",
+]
+DESCRIPTIONS = [
+    "Single Storey Dual Occupancy Attached",
+    "New Dwelling on Flood Prone Land",
+    "Swimming Pool",
+    "Alterations and Additions to Dwelling",
+    "Two Lot Subdivision",
+    "Shed",
+]
+SUBURBS = ["WORRIGEE", "BADAGARANG", "NOWRA", "ULLADULLA", "VINCENTIA", "CULBURRA BEACH"]
+STREETS = ["Old Southern Rd", "Myrtle Drive", "Kinghorne St", "Princes Hwy", "Elizabeth Dr"]
+APPLICANTS = ["Bacchus Partners Pty Ltd", "Buildcert NSW Pty Ltd", "J Smith", "Coastal Homes Pty Ltd"]
+DECISIONS = ["Approved on {}", "Refused on {}", "Withdrawn on {}", ""]
+FEES_NO_FEES_TEXT = "No fees recorded against this application."
+CONTACT_NO_EXHIBITION_TEXT = (
+    "Application Is Not on exhibition, please call Council on 1300 293 111 if you require assistance."
+)
+
+
+# ==================== SYNTHETIC DATA ====================
+
+def generate_das(count, start_date="01/01/2024", end_date="31/12/2025", seed=1):
+    """Deterministic synthetic DAs spread evenly over start_date..end_date."""
+    rng = random.Random(seed)
+    start = datetime.strptime(start_date, DATE_FORMAT)
+    span = (datetime.strptime(end_date, DATE_FORMAT) - start).days + 1
+
+    das = []
+    for i in range(count):
+        lodged = start + timedelta(days=(i * span) // max(count, 1))
+        prefix = rng.choice(PREFIXES)
+        decision = rng.choice(DECISIONS)
+        decided = lodged + timedelta(days=rng.randint(1, 60))
+        key = 700000 + i
+        das.append({
+            "key": key,
+            "propkey": rng.randint(10000, 1999999),
+            "da": f"{prefix}{lodged:%y}/{1000 + i}",
+            "lodged": lodged,
+            "description": rng.choice(DESCRIPTIONS),
+            "decision": decision.format(decided.strftime(DATE_FORMAT)) if decision else "",
+            "category": rng.choice(CATEGORIES),
+            "address": f"{rng.randint(1, 300)} {rng.choice(STREETS)}, {rng.choice(SUBURBS)}",
+            "applicant": rng.choice(APPLICANTS),
+            "fees": FEES_NO_FEES_TEXT if rng.random() < 0.7 else f"Application fee ${rng.randint(100, 5000)}.00",
+            "documents": [
+                {"id": key * 10 + n, "title": f"CR-{lodged:%Y}-{rng.randint(10000, 99999)} - {kind}"}
+                for n, kind in enumerate(rng.sample(["Certificate", "Plans", "Notice"], rng.randint(0, 3)))
+            ],
+        })
+    return das
+
+
+# ==================== PAGE TEMPLATES ====================
+
+PAGE = """<!DOCTYPE html>
+<html><head><title>MasterView - ApplicationMaster</title>
+<script type="text/javascript">
+function __doPostBack(target, argument) {{
+  var form = document.forms[0];
+  form.__EVENTTARGET.value = target;
+  form.__EVENTARGUMENT.value = argument;
+  form.submit();
+}}
+</script></head>
+<body>
+<form method="post" action="{action}" id="aspnetForm">
+<input type="hidden" name="__EVENTTARGET" id="__EVENTTARGET" value="" />
+<input type="hidden" name="__EVENTARGUMENT" id="__EVENTARGUMENT" value="" />
+<input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="{viewstate}" />
+<input type="hidden" name="__EVENTVALIDATION" id="__EVENTVALIDATION" value="{validation}" />
+{body}
+</form>
+</body></html>"""
+
+DISCLAIMER_BODY = """<div class="disclaimer"><p>Terms and conditions of use.</p>
+<input type="submit" name="ctl00$cphContent$ctl01$Button1" value="Agree" />
+<input type="submit" name="ctl00$cphContent$ctl01$Button2" value="Disagree" /></div>"""
+
+HOME_BODY = """<ul class="menu">
+<li><a href="Default.aspx?page=found"><span>DA Tracking</span></a></li>
+</ul>"""
+
+SEARCH_BODY = """<div class="searchTabs">
+<a href="#" onclick="document.getElementById('advSearch').style.display='block'; return false;"><span>Advanced Search</span></a>
+</div>
+<div id="advSearch" style="display:{display}">
+From <input type="text" id="{p}ctl03_dateInput" name="{n}ctl03$dateInput" value="{start}" />
+To <input type="text" id="{p}ctl05_dateInput" name="{n}ctl05$dateInput" value="{end}" />
+<input type="submit" id="{p}btnSearch" name="{n}btnSearch" value="Search" />
+</div>
+{results}"""
+
+DETAIL_BODY = """<div class="detailHeader"><h2>{da}</h2>
+<img src="/masterviewUI/Images/HeadArrowDown.png" alt="Expand All"
+ onclick="var s = document.querySelectorAll('.section'); for (var i = 0; i < s.length; i++) s[i].style.display = 'block';" /></div>
+<div class="makeTableRow_Content">
+<div id="lblDetails"><b>Description:</b> {description}<br /><b>Submitted:</b> {lodged}</div>
+<div id="lblDecision">{decision}</div>
+<div class="section" style="display:none"><div id="lblCat">{category}</div></div>
+<div class="section" style="display:none"><div id="lblProp"><a href="#">{address}</a></div></div>
+<div class="section" style="display:none"><div id="lblPeople">Applicant: {applicant}</div></div>
+<div class="section" style="display:none"><div id="lblProg"><table><tr><th>Actioned</th><th>Description</th><th>Date Sent</th><th>Date Due</th><th>Date Rec.</th><th>Status</th></tr></table></div></div>
+<div class="section" style="display:none"><div id="lblFees">{fees}</div></div>
+<div class="section" style="display:none"><div id="lblDocs">{documents}</div></div>
+<div class="section" style="display:none"><div id="lbl91">{contact}</div></div>
+</div>"""
+
+
+def encode_state(state):
+    return base64.b64encode(json.dumps(state).encode("utf-8")).decode("ascii")
+
+
+def decode_state(value):
+    try:
+        return json.loads(base64.b64decode(value or ""))
+    except ValueError:
+        return {}
+
+
+# ==================== SERVER ====================
+
+class FakeMasterView:
+    """
+    Threaded HTTP server emulating MasterView for `das` synthetic applications.
+    latency: mean seconds added to every response (uniform 0.5x-1.5x jitter).
+    error_rate: fraction of requests answered with HTTP 500/503.
+    page_size / max_page_size: default grid page size and the largest
+    PageSize command the grid accepts.
+    """
+
+    def __init__(self, das=10000, latency=0.0, error_rate=0.0, page_size=10,
+                 max_page_size=250, seed=1, start_date="01/01/2024", end_date="31/12/2025"):
+        self.das = generate_das(das, start_date, end_date, seed)
+        self.by_key = {da["key"]: da for da in self.das}
+        self.documents = {doc["id"]: da for da in self.das for doc in da["documents"]}
+        self.latency = latency
+        self.error_rate = error_rate
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.detail_requests = {}     # key -> perf_counter() of first request
+        self.request_count = 0
+        self.error_count = 0
+        self.server = None
+        self.thread = None
+
+    # ---------- lifecycle ----------
+
+    def start(self, host="127.0.0.1", port=0):
+        """Serve in a background thread; returns the site root URL."""
+        fake = self
+
+        class Handler(MasterViewHandler):
+            site = fake
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return f"http://{host}:{self.server.server_address[1]}"
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+    # ---------- fault injection ----------
+
+    def inject(self):
+        """Sleep for the configured latency; return an error status or None."""
+        with self.lock:
+            self.request_count += 1
+            delay = self.latency * (0.5 + self.rng.random()) if self.latency else 0
+            fail = self.error_rate and self.rng.random() < self.error_rate
+            if fail:
+                self.error_count += 1
+        if delay:
+            time.sleep(delay)
+        return self.rng.choice([500, 503]) if fail else None
+
+    # ---------- search ----------
+
+    def search(self, start_date, end_date):
+        try:
+            start = datetime.strptime(start_date.strip(), DATE_FORMAT)
+            end = datetime.strptime(end_date.strip(), DATE_FORMAT)
+        except ValueError:
+            return []
+        return [da for da in self.das if start <= da["lodged"] <= end]
+
+
+class MasterViewHandler(BaseHTTPRequestHandler):
+    site = None
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    # ---------- plumbing ----------
+
+    def send_html(self, body, status=200, headers=None):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def redirect(self, location, headers=None):
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+    def page(self, body, action="Default.aspx", state=None):
+        state = state or {}
+        return PAGE.format(
+            action=html.escape(action),
+            viewstate=encode_state(state),
+            validation=encode_state({"v": len(json.dumps(state))}),
+            body=body,
+        )
+
+    def has_disclaimer(self):
+        return f"{DISCLAIMER_COOKIE}=1" in (self.headers.get("Cookie") or "")
+
+    def route(self):
+        parts = urlsplit(self.path)
+        if parts.path.lower() != (APP_PATH + "default.aspx").lower():
+            return None, None
+        return parts, {k: v[0] for k, v in parse_qs(parts.query).items()}
+
+    # ---------- GET ----------
+
+    def do_GET(self):
+        parts, query = self.route()
+        if parts is None:
+            if self.path.lower().startswith("/masterviewui/common/output/document.aspx"):
+                return self.send_document()
+            return self.send_html("Not found", 404)
+
+        status = self.site.inject()
+        if status:
+            return self.send_html("Server Error", status)
+
+        if not self.has_disclaimer():
+            return self.send_html(self.page(DISCLAIMER_BODY))
+
+        page = query.get("page", "").lower()
+        if page == "found":
+            return self.send_html(self.page(self.search_body(), "Default.aspx?page=found"))
+        if page == "wrapper":
+            return self.send_detail(query)
+        return self.send_html(self.page(HOME_BODY))
+
+    def send_detail(self, query):
+        try:
+            da = self.site.by_key[int(query.get("key", ""))]
+        except (KeyError, ValueError):
+            return self.send_html(self.page("<p>Application not found</p>"), 404)
+
+        with self.site.lock:
+            self.site.detail_requests.setdefault(da["key"], time.perf_counter())
+
+        documents = "<br />".join(
+            f'<a href="/masterviewUI/Common/Output/Document.aspx?id={doc["id"]}">'
+            f'{html.escape(da["da"])}  {html.escape(da["applicant"])} - {html.escape(doc["title"])}</a>'
+            for doc in da["documents"]
+        )
+        body = DETAIL_BODY.format(
+            da=html.escape(da["da"]),
+            description=html.escape(da["description"]),
+            lodged=da["lodged"].strftime(DATE_FORMAT),
+            decision=html.escape(da["decision"]),
+            category=html.escape(da["category"]),
+            address=html.escape(da["address"]),
+            applicant=html.escape(da["applicant"]),
+            fees=html.escape(da["fees"]),
+            documents=documents,
+            contact=html.escape(CONTACT_NO_EXHIBITION_TEXT),
+        )
+        return self.send_html(self.page(body, f"Default.aspx?page=wrapper&key={da['key']}"))
+
+    def send_document(self):
+        status = self.site.inject()
+        if status:
+            return self.send_html("Server Error", status)
+        query = {k: v[0] for k, v in parse_qs(urlsplit(self.path).query).items()}
+        try:
+            doc_id = int(query.get("id", ""))
+            da = self.site.documents[doc_id]
+        except (KeyError, ValueError):
+            return self.send_html("Not found", 404)
+
+        data = f"%PDF-1.4\n% {da['da']} document {doc_id}\n".encode("utf-8") + b"0" * 2048
+        self.send_response(200)
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("Content-Disposition", f'attachment; filename="{doc_id}.pdf"')
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    # ---------- POST ----------
+
+    def do_POST(self):
+        parts, query = self.route()
+        length = int(self.headers.get("Content-Length") or 0)
+        form = {k: v[0] for k, v in parse_qs(self.rfile.read(length).decode("utf-8"), keep_blank_values=True).items()}
+        if parts is None:
+            return self.send_html("Not found", 404)
+
+        status = self.site.inject()
+        if status:
+            return self.send_html("Server Error", status)
+
+        if form.get("ctl00$cphContent$ctl01$Button1") == "Agree":
+            return self.redirect(
+                APP_PATH + "Default.aspx",
+                {"Set-Cookie": f"{DISCLAIMER_COOKIE}=1; Path=/"},
+            )
+        if not self.has_disclaimer():
+            return self.send_html(self.page(DISCLAIMER_BODY))
+
+        state = decode_state(form.get("__VIEWSTATE"))
+        prefix = SEARCH_PREFIX.replace("_", "$")
+        target = form.get("__EVENTTARGET", "")
+        argument = form.get("__EVENTARGUMENT", "")
+
+        if prefix + "btnSearch" in form:
+            state = {
+                "start": form.get(prefix + "ctl03$dateInput", ""),
+                "end": form.get(prefix + "ctl05$dateInput", ""),
+                "page": 0,
+                "size": self.site.page_size,
+            }
+        elif target == NEXT_UNIQUE_ID:
+            state["page"] = state.get("page", 0) + 1
+        elif target == GRID_UNIQUE_ID and argument.startswith(f"FireCommand:{MASTER_UNIQUE_ID};"):
+            _, command, value = argument.split(";", 2)
+            if command == "PageSize":
+                size = int(value)
+                if size > self.site.max_page_size:
+                    return self.send_html(self.page("<p>Invalid page size</p>"), 500)
+                state["size"], state["page"] = size, 0
+            elif command == "Page":
+                state["page"] = state.get("page", 0) + 1 if value.lower() == "next" else int(value) - 1
+
+        return self.send_html(self.page(self.search_body(state), "Default.aspx?page=found", state))
+
+    # ---------- results grid ----------
+
+    def search_body(self, state=None):
+        if not state or "start" not in state:
+            return SEARCH_BODY.format(
+                display="none", p=SEARCH_PREFIX, n=SEARCH_PREFIX.replace("_", "$"),
+                start="", end="", results="",
+            )
+
+        matches = self.site.search(state["start"], state["end"])
+        size = state.get("size") or self.site.page_size
+        total_pages = max(1, -(-len(matches) // size))
+        page = min(max(state.get("page", 0), 0), total_pages - 1)
+        state["page"] = page
+
+        if not matches:
+            results = '<div class="rgNoRecords"><span>No records to display.</span></div>'
+        else:
+            rows = "\n".join(
+                f'<tr class="{"rgRow" if n % 2 == 0 else "rgAltRow"}">'
+                f'<td><a href="default.aspx?page=wrapper&amp;key={da["key"]}&amp;propkey={da["propkey"]}">'
+                f'<img src="/masterviewUI/Images/GridShowButton.png" alt="Show" /></a></td>'
+                f'<td>{html.escape(da["da"])}</td>'
+                f'<td>{da["lodged"].strftime(DATE_FORMAT)}</td>'
+                f'<td>{html.escape(da["description"])}</td>'
+                f'<td>{html.escape(da["category"])}</td>'
+                f'<td>{html.escape(da["address"])}</td></tr>'
+                for n, da in enumerate(matches[page * size:(page + 1) * size])
+            )
+            results = f"""<div id="{GRID_CLIENT_ID}" class="RadGrid">
+<table class="rgMasterTable" id="{MASTER_CLIENT_ID}">
+<thead><tr><th></th><th>Application</th><th>Lodged</th><th>Description</th><th>Category</th><th>Address</th></tr></thead>
+<tbody>
+{rows}
+</tbody></table>
+<div class="rgPager">
+<input type="button" name="{NEXT_UNIQUE_ID}" class="rgPageNext" value=" "
+ onclick="__doPostBack('{NEXT_UNIQUE_ID}',''); return false;" />
+<div class="rgWrap rgInfoPart">Page {page + 1}: <strong>{len(matches)}</strong> items in <strong>{total_pages}</strong> pages</div>
+</div></div>"""
+
+        return SEARCH_BODY.format(
+            display="block", p=SEARCH_PREFIX, n=SEARCH_PREFIX.replace("_", "$"),
+            start=html.escape(state["start"]), end=html.escape(state["end"]), results=results,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local MasterView stand-in server")
+    parser.add_argument("--das", type=int, default=10000)
+    parser.add_argument("--latency", type=float, default=0.0, help="mean seconds per response")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--max-page-size", type=int, default=250)
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+
+    site = FakeMasterView(
+        das=args.das, latency=args.latency, error_rate=args.error_rate,
+        page_size=args.page_size, max_page_size=args.max_page_size,
+    )
+    root = site.start(port=args.port)
+    print(f"🚀 Fake MasterView with {args.das} DAs at {root}{APP_PATH}Default.aspx")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        site.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+# Fetch control for detail-page requests
+# Classifies failures, retries transient ones with jittered exponential backoff,
+# adapts request rate and concurrency (AIMD) to observed latency and errors,
+# and pauses all fetches behind a circuit breaker while the site is down.
+
+import asyncio
+import random
+import threading
+import time
+
+
+TRANSIENT = "transient"
+FATAL = "fatal"
+
+# HTTP statuses worth retrying: timeouts, throttling and server errors
+RETRY_STATUSES = {408, 425, 429}
+# Exception class names that signal a dead connection or slow server
+TRANSIENT_NAME_PARTS = ("Timeout", "Connection", "ServerDisconnected", "ClientPayload", "ClientOS")
+FATAL_NAME_PARTS = ("Invalid", "MissingSchema", "TooManyRedirects")
+# Browser errors (e.g. selenium WebDriverException) only say what went wrong in
+# their message: Chrome network errors and a dropped DevTools connection
+TRANSIENT_MESSAGE_PARTS = ("net::ERR_", "disconnected", "Connection refused", "Connection reset")
+
+
+def classify_error(error):
+    """TRANSIENT (retry, back off) or FATAL (give up on this URL) for an exception."""
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None) or getattr(error, "status", None)
+    if isinstance(status, int):
+        return TRANSIENT if status in RETRY_STATUSES or status >= 500 else FATAL
+
+    name = type(error).__name__
+    if any(part in name for part in FATAL_NAME_PARTS):
+        return FATAL
+    if isinstance(error, (TimeoutError, ConnectionError)) or any(part in name for part in TRANSIENT_NAME_PARTS):
+        return TRANSIENT
+    message = str(error)
+    if any(part in message for part in TRANSIENT_MESSAGE_PARTS):
+        return TRANSIENT
+    return FATAL
+
+
+def backoff_delay(attempt, base, cap):
+    """Full-jitter exponential backoff: uniform(0, min(cap, base * 2**(attempt-1)))."""
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+
+class AimdController:
+    """
+    Additive-increase / multiplicative-decrease of a request rate and a
+    concurrency limit. Each fast success adds `increase` x the ceiling rate
+    (and ~1 slot per window of successes); errors or responses slower than
+    latency_target multiply both by `decrease`.
+    """
+
+    def __init__(self, rate, concurrency=1, min_rate=0.5, latency_target=5.0,
+                 increase=0.05, decrease=0.5):
+        self.max_rate = float(rate)
+        self.max_concurrency = max(1, int(concurrency))
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.latency_target = latency_target
+        self.increase = increase
+        self.decrease = decrease
+        self.rate = self.max_rate
+        self.concurrency = float(self.max_concurrency)
+
+    @property
+    def limit(self):
+        return max(1, int(self.concurrency))
+
+    def on_success(self, latency):
+        if latency > self.latency_target:
+            self._back_off()
+            return
+        self.rate = min(self.max_rate, self.rate + self.increase * self.max_rate)
+        self.concurrency = min(self.max_concurrency, self.concurrency + 1 / self.concurrency)
+
+    def on_failure(self):
+        self._back_off()
+
+    def _back_off(self):
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+        self.concurrency = max(1.0, self.concurrency * self.decrease)
+
+
+class CircuitBreaker:
+    """
+    Opens after `threshold` consecutive failures; while open, wait_time()
+    is the time left in the cooldown. After the cooldown one trial request
+    is let through (half-open): success closes it, failure re-opens it.
+    """
+
+    def __init__(self, threshold=10, cooldown=60.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+        self.trips = 0
+
+    def wait_time(self):
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.cooldown - time.monotonic())
+
+    @property
+    def half_open(self):
+        return self.opened_at is not None and self.wait_time() == 0
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+
+    def record_failure(self):
+        self.probing = False
+        self.failures += 1
+        if self.failures >= self.threshold:
+            if self.opened_at is None or self.wait_time() == 0:
+                self.trips += 1
+                print(f"⛔ Circuit open after {self.failures} consecutive failures - "
+                      f"pausing fetches for {self.cooldown:.0f}s")
+            self.opened_at = time.monotonic()
+
+    def release(self):
+        """The trial request ended without saying whether the site is back; allow another."""
+        self.probing = False
+
+
+class FetchController:
+    """
+    Wraps page fetches with pacing, an adaptive in-flight limit, retries and
+    a circuit breaker. Thread-safe; call() for blocking code, acall() for
+    coroutines, and try_acquire() + complete()/fail() for fetches whose
+    completion is observed elsewhere. One controller should front one host.
+    """
+
+    def __init__(self, rate, concurrency=1, max_attempts=4, backoff_base=1.0, backoff_cap=60.0,
+                 min_rate=0.5, latency_target=5.0, breaker_threshold=10, breaker_cooldown=60.0):
+        self.aimd = AimdController(rate, concurrency, min_rate, latency_target)
+        self.breaker = CircuitBreaker(breaker_threshold, breaker_cooldown)
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+        self._in_flight = 0
+
+    # ---------- admission ----------
+
+    def try_acquire(self):
+        """
+        0 when a request may start now (slot taken), else seconds to wait.
+        A taken slot must be handed back with complete() or fail().
+        """
+        with self._lock:
+            wait = self.breaker.wait_time()
+            if wait > 0:
+                return wait
+            if self.breaker.probing:
+                return 0.05
+            now = time.monotonic()
+            if now < self._next_slot:
+                return self._next_slot - now
+            if self._in_flight >= self.aimd.limit:
+                return 0.05
+            if self.breaker.half_open:
+                # This request is the trial; everything else waits for its outcome
+                self.breaker.probing = True
+            self._in_flight += 1
+            self._next_slot = now + 1 / self.aimd.rate
+            self.requests += 1
+            return 0
+
+    def _finish(self, latency=None, kind=None):
+        with self._lock:
+            self._in_flight -= 1
+            if kind is None:
+                self.aimd.on_success(latency)
+                self.breaker.record_success()
+                return
+            self.failures += 1
+            if kind == TRANSIENT:
+                self.aimd.on_failure()
+                self.breaker.record_failure()
+            else:
+                self.breaker.release()
+
+    def _should_retry(self, kind, attempt):
+        if kind == TRANSIENT and attempt < self.max_attempts:
+            with self._lock:
+                self.retries += 1
+            return True
+        return False
+
+    def complete(self, latency):
+        """Report a try_acquire()d fetch that succeeded after `latency` seconds."""
+        self._finish(latency=latency)
+
+    def fail(self, error, attempt):
+        """Report a try_acquire()d fetch that raised `error`; True if it should be retried."""
+        kind = classify_error(error)
+        self._finish(kind=kind)
+        return self._should_retry(kind, attempt)
+
+    # ---------- fetch wrappers ----------
+
+    def call(self, fetch):
+        """Run fetch() under the controller; re-raises the last error if it never succeeds."""
+        for attempt in range(1, self.max_attempts + 1):
+            while True:
+                wait = self.try_acquire()
+                if not wait:
+                    break
+                time.sleep(wait)
+
+            start = time.perf_counter()
+            try:
+                result = fetch()
+            except Exception as e:
+                kind = classify_error(e)
+                self._finish(kind=kind)
+                if not self._should_retry(kind, attempt):
+                    raise
+                time.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_cap))
+                continue
+            self._finish(latency=time.perf_counter() - start)
+            return result
+
+    async def acall(self, fetch):
+        """Async counterpart of call(); fetch() must return an awaitable."""
+        for attempt in range(1, self.max_attempts + 1):
+            while True:
+                wait = self.try_acquire()
+                if not wait:
+                    break
+                await asyncio.sleep(wait)
+
+            start = time.perf_counter()
+            try:
+                result = await fetch()
+            except Exception as e:
+                kind = classify_error(e)
+                self._finish(kind=kind)
+                if not self._should_retry(kind, attempt):
+                    raise
+                await asyncio.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_cap))
+                continue
+            self._finish(latency=time.perf_counter() - start)
+            return result
+
+    def summary(self):
+        return (f"{self.requests} requests, {self.retries} retries, {self.failures} failed attempts, "
+                f"{self.breaker.trips} breaker trips; final rate {self.aimd.rate:.2f}/s, "
+                f"concurrency {self.aimd.limit}")
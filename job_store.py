@@ -0,0 +1,249 @@
+# Crash-safe job store for the Shoalhaven DA scraper
+# Persists each date range's DA+URL list, per-DA scrape status and every
+# extracted record in a local SQLite file, so interrupted runs can resume.
+# Also keeps the latest record + fingerprint per DA for incremental runs.
+
+import hashlib
+import json
+import sqlite3
+import time
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    range_key   TEXT PRIMARY KEY,
+    total_items INTEGER,
+    total_pages INTEGER,
+    collected   INTEGER NOT NULL DEFAULT 0,
+    updated_at  REAL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    range_key  TEXT NOT NULL,
+    da         TEXT NOT NULL,
+    url        TEXT NOT NULL,
+    position   INTEGER NOT NULL,
+    status     TEXT NOT NULL DEFAULT 'pending',
+    attempts   INTEGER NOT NULL DEFAULT 0,
+    error      TEXT,
+    updated_at REAL,
+    PRIMARY KEY (range_key, da)
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (range_key, status, position);
+CREATE TABLE IF NOT EXISTS records (
+    range_key TEXT NOT NULL,
+    da        TEXT NOT NULL,
+    record    TEXT NOT NULL,
+    PRIMARY KEY (range_key, da)
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    da          TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    record      TEXT NOT NULL,
+    final       INTEGER NOT NULL DEFAULT 0,
+    checked_at  REAL NOT NULL,
+    changed_at  REAL NOT NULL
+);
+"""
+
+
+def range_key(start_date, end_date):
+    """Key identifying one search window, e.g. '01/09/2025-30/09/2025'."""
+    return f"{start_date}-{end_date}"
+
+
+def record_fingerprint(record, fields):
+    """SHA-256 over the given fields of a record, independent of key order."""
+    payload = json.dumps([record.get(field) or "" for field in fields], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class JobStore:
+    """
+    SQLite-backed job list for one or more date ranges.
+    Every status change is committed immediately (WAL mode), so a crash loses
+    at most the record being scraped.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    # ---------- collection ----------
+
+    def is_collected(self, key):
+        """True once the full DA+URL list for this range has been saved."""
+        row = self.conn.execute(
+            "SELECT collected FROM runs WHERE range_key = ?", (key,)
+        ).fetchone()
+        return bool(row and row[0])
+
+    def run_totals(self, key):
+        """(total_items, total_pages) recorded when the range was collected."""
+        row = self.conn.execute(
+            "SELECT total_items, total_pages FROM runs WHERE range_key = ?", (key,)
+        ).fetchone()
+        return (row[0], row[1]) if row else (None, None)
+
+    def save_urls(self, key, da_url_list, total_items=None, total_pages=None, complete=True,
+                  start_position=0):
+        """
+        Record the collected DA+URL list; existing DAs keep their status.
+        With complete=False the range is not marked collected, so the next
+        run searches again (e.g. after a backfill window failed).
+        start_position lets a list be saved page by page, in order.
+        """
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO jobs (range_key, da, url, position, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(key, item["da"], item["url"], start_position + i, now)
+                 for i, item in enumerate(da_url_list)],
+            )
+            self.conn.execute(
+                "INSERT INTO runs (range_key, total_items, total_pages, collected, updated_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (range_key) DO UPDATE SET total_items = excluded.total_items, "
+                "total_pages = excluded.total_pages, collected = excluded.collected, "
+                "updated_at = excluded.updated_at",
+                (key, total_items, total_pages, int(complete), now),
+            )
+
+    # ---------- scraping ----------
+
+    def pending(self, key):
+        """DAs still to scrape (pending or failed), in collection order."""
+        rows = self.conn.execute(
+            "SELECT da, url FROM jobs WHERE range_key = ? AND status != 'done' ORDER BY position",
+            (key,),
+        )
+        return [{"da": da, "url": url} for da, url in rows]
+
+    def requeue(self, key):
+        """Mark every DA of the range pending again and drop its saved records."""
+        with self.conn:
+            self.conn.execute(
+                "UPDATE jobs SET status = 'pending', error = NULL, updated_at = ? WHERE range_key = ?",
+                (time.time(), key),
+            )
+            self.conn.execute("DELETE FROM records WHERE range_key = ?", (key,))
+
+    def done_das(self, key):
+        """Set of DAs already scraped for the range."""
+        rows = self.conn.execute(
+            "SELECT da FROM jobs WHERE range_key = ? AND status = 'done'", (key,)
+        )
+        return {da for (da,) in rows}
+
+    def mark_done(self, key, da, record):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO records (range_key, da, record) VALUES (?, ?, ?)",
+                (key, da, json.dumps(dict(record), ensure_ascii=False)),
+            )
+            self.conn.execute(
+                "UPDATE jobs SET status = 'done', attempts = attempts + 1, error = NULL, "
+                "updated_at = ? WHERE range_key = ? AND da = ?",
+                (time.time(), key, da),
+            )
+
+    def mark_failed(self, key, da, error):
+        with self.conn:
+            self.conn.execute(
+                "UPDATE jobs SET status = 'failed', attempts = attempts + 1, error = ?, "
+                "updated_at = ? WHERE range_key = ? AND da = ?",
+                (str(error), time.time(), key, da),
+            )
+
+    # ---------- results ----------
+
+    def records(self, key):
+        """Yield every saved record for the range, in collection order."""
+        rows = self.conn.execute(
+            "SELECT r.record FROM records r JOIN jobs j "
+            "ON j.range_key = r.range_key AND j.da = r.da "
+            "WHERE r.range_key = ? ORDER BY j.position",
+            (key,),
+        )
+        for (record,) in rows:
+            yield json.loads(record)
+
+    # ---------- incremental snapshots ----------
+
+    def fresh_snapshot(self, da, max_age):
+        """
+        Last record of a DA whose decision was final when it was checked
+        less than max_age seconds ago, or None if it must be re-fetched.
+        """
+        row = self.conn.execute(
+            "SELECT record FROM snapshots WHERE da = ? AND final = 1 AND checked_at >= ?",
+            (da, time.time() - max_age),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def merge_snapshot(self, da, record, fields):
+        """
+        The DA's stored snapshot with `fields` (and its links) taken from
+        record, for a projected run that only fetched those columns. None
+        when the DA has no snapshot yet.
+        """
+        row = self.conn.execute("SELECT record FROM snapshots WHERE da = ?", (da,)).fetchone()
+        if row is None:
+            return None
+        merged = json.loads(row[0])
+        for field in ["DA_Number", "Detail_URL"] + list(fields):
+            merged[field] = record.get(field) or ""
+        merged.pop("Document_Links", None)
+        if record.get("Document_Links"):
+            merged["Document_Links"] = record["Document_Links"]
+        return merged
+
+    def update_snapshot(self, da, record, fields, final):
+        """
+        Save the latest record for a DA. Returns None when its fingerprint is
+        unchanged, else {'change': 'added'|'modified', 'fields': {field: {'old', 'new'}}}.
+        """
+        now = time.time()
+        fingerprint = record_fingerprint(record, fields)
+        row = self.conn.execute(
+            "SELECT fingerprint, record FROM snapshots WHERE da = ?", (da,)
+        ).fetchone()
+
+        if row and row[0] == fingerprint:
+            with self.conn:
+                self.conn.execute(
+                    "UPDATE snapshots SET checked_at = ?, final = ? WHERE da = ?",
+                    (now, int(final), da),
+                )
+            return None
+
+        previous = json.loads(row[1]) if row else {}
+        changed = {
+            field: {"old": previous.get(field) or "", "new": record.get(field) or ""}
+            for field in fields
+            if (previous.get(field) or "") != (record.get(field) or "")
+        }
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO snapshots "
+                "(da, fingerprint, record, final, checked_at, changed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (da, fingerprint, json.dumps(dict(record), ensure_ascii=False), int(final), now, now),
+            )
+        return {"change": "modified" if row else "added", "fields": changed}
+
+    def status_counts(self, key):
+        """{'pending': n, 'done': n, 'failed': n} for the range."""
+        counts = {"pending": 0, "done": 0, "failed": 0}
+        rows = self.conn.execute(
+            "SELECT status, COUNT(*) FROM jobs WHERE range_key = ? GROUP BY status", (key,)
+        )
+        for status, count in rows:
+            counts[status] = count
+        return counts
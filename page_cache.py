@@ -0,0 +1,118 @@
+# On-disk compressed cache of raw detail-page HTML
+# Entries are gzip'd JSON files addressed by the SHA-256 of the normalized URL,
+# so cleaning rules can be re-applied offline ("replay") without the council site.
+
+import gzip
+import hashlib
+import json
+import os
+import time
+
+
+class PageCache:
+    """
+    Cache of detail pages under `root`, two-level sharded by key prefix.
+    ttl: seconds an entry stays fresh for get() (None = forever).
+    max_bytes: evict() removes the oldest entries beyond this size (None = unbounded).
+    normalize: URL normalizer applied before hashing (e.g. normalize_url).
+    """
+
+    def __init__(self, root, ttl=None, max_bytes=None, normalize=None):
+        self.root = root
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.normalize = normalize or (lambda url: url)
+        os.makedirs(root, exist_ok=True)
+
+    def key(self, url):
+        return hashlib.sha256(self.normalize(url).encode("utf-8")).hexdigest()
+
+    def path(self, url):
+        key = self.key(url)
+        return os.path.join(self.root, key[:2], key + ".json.gz")
+
+    # ---------- read / write ----------
+
+    def get(self, url):
+        """Return (html, final_url) for a fresh entry, or None."""
+        path = self.path(url)
+        try:
+            if self.ttl is not None and time.time() - os.path.getmtime(path) > self.ttl:
+                return None
+            entry = self._load(path)
+        except (OSError, ValueError):
+            return None
+        return entry["html"], entry.get("final_url") or entry["url"]
+
+    def put(self, url, html, final_url=None):
+        """Store a page atomically; the file mtime doubles as fetch time."""
+        path = self.path(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        entry = {
+            "url": self.normalize(url),
+            "final_url": final_url,
+            "fetched_at": time.time(),
+            "html": html,
+        }
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _load(path):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+
+    # ---------- maintenance ----------
+
+    def _files(self):
+        """[(mtime, size, path)] for every entry, oldest first."""
+        files = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if not name.endswith(".json.gz"):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+        return files
+
+    def evict(self):
+        """Drop expired entries, then the oldest until under max_bytes. Returns count removed."""
+        files = self._files()
+        now = time.time()
+        total = sum(size for _, size, _ in files)
+        removed = 0
+
+        for mtime, size, path in files:
+            expired = self.ttl is not None and now - mtime > self.ttl
+            oversize = self.max_bytes is not None and total > self.max_bytes
+            if not (expired or oversize):
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+
+        return removed
+
+    def entries(self):
+        """Yield (url, html, final_url) for every entry in fetch order, ignoring TTL."""
+        for _, _, path in self._files():
+            try:
+                entry = self._load(path)
+            except (OSError, ValueError):
+                continue
+            yield entry["url"], entry["html"], entry.get("final_url") or entry["url"]
+
+    def stats(self):
+        """(entry_count, total_bytes)."""
+        files = self._files()
+        return len(files), sum(size for _, size, _ in files)
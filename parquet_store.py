@@ -0,0 +1,119 @@
+# Columnar Parquet output for scraped DA records
+# Records are typed (dates parsed from Submitted_Date / Decision), grouped into
+# hive-style submitted_month=YYYY-MM partitions and appended as new files, so
+# earlier runs are never rewritten. pyarrow is imported lazily.
+
+from datetime import date, datetime, timezone
+import os
+import re
+import uuid
+
+
+# First dd/mm/yyyy in a field, e.g. "Approved on 01/09/2025"
+AU_DATE_RE = re.compile(r"\b(\d{1,2})/(\d{1,2})/(\d{4})\b")
+UNKNOWN_MONTH = "unknown"
+
+# Typed columns; every other header is stored as a string
+DATE_COLUMNS = {"Submitted_Date"}
+EXTRA_COLUMNS = ["Decision_Date", "Scraped_At"]
+
+
+def parse_au_date(text):
+    """datetime.date for the first dd/mm/yyyy in text, or None."""
+    match = AU_DATE_RE.search(text or "")
+    if not match:
+        return None
+    day, month, year = (int(part) for part in match.groups())
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def submission_month(record):
+    """Partition value for a record: 'YYYY-MM' of Submitted_Date or 'unknown'."""
+    submitted = parse_au_date(record.get("Submitted_Date"))
+    return submitted.strftime("%Y-%m") if submitted else UNKNOWN_MONTH
+
+
+class ParquetRecordWriter:
+    """
+    Buffers records per submission month and writes each buffer as
+    <root>/submitted_month=YYYY-MM/part-<run>-<n>.parquet once it reaches
+    rows_per_file, and on close(). Same write/close interface as CsvRecordWriter.
+    """
+
+    def __init__(self, root, headers, rows_per_file=50000, compression="zstd"):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        self._pa = pa
+        self._pq = pq
+
+        self.root = root
+        self.headers = list(headers)
+        self.rows_per_file = rows_per_file
+        self.compression = compression
+        self.run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S") + "-" + uuid.uuid4().hex[:8]
+        self.count = 0
+        self.files = []
+        self._buffers = {}
+        self._sequence = 0
+        self._closed = False
+
+        fields = []
+        for header in self.headers:
+            fields.append(pa.field(header, pa.date32() if header in DATE_COLUMNS else pa.string()))
+            if header == "Decision":
+                fields.append(pa.field("Decision_Date", pa.date32()))
+        fields.append(pa.field("Scraped_At", pa.timestamp("s", tz="UTC")))
+        self.schema = pa.schema(fields)
+        os.makedirs(root, exist_ok=True)
+
+    def _typed_row(self, record):
+        row = {}
+        for header in self.headers:
+            value = record.get(header) or ""
+            row[header] = parse_au_date(value) if header in DATE_COLUMNS else value
+        if "Decision" in self.headers:
+            row["Decision_Date"] = parse_au_date(record.get("Decision"))
+        row["Scraped_At"] = datetime.now(timezone.utc).replace(microsecond=0)
+        return row
+
+    def write(self, record):
+        month = submission_month(record)
+        buffer = self._buffers.setdefault(month, [])
+        buffer.append(self._typed_row(record))
+        self.count += 1
+        if len(buffer) >= self.rows_per_file:
+            self._flush(month)
+
+    def _flush(self, month):
+        rows = self._buffers.pop(month, None)
+        if not rows:
+            return
+
+        partition = os.path.join(self.root, f"submitted_month={month}")
+        os.makedirs(partition, exist_ok=True)
+        self._sequence += 1
+        name = f"part-{self.run_id}-{self._sequence:05d}.parquet"
+        path = os.path.join(partition, name)
+        # Dot-prefixed temp files are ignored by Parquet dataset readers
+        tmp = os.path.join(partition, "." + name + ".tmp")
+
+        table = self._pa.Table.from_pylist(rows, schema=self.schema)
+        self._pq.write_table(table, tmp, compression=self.compression)
+        os.replace(tmp, path)
+        self.files.append(path)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        for month in list(self._buffers):
+            self._flush(month)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
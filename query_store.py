@@ -0,0 +1,303 @@
+# Indexed local query store for scraped DA records
+# Upserts records by DA_Number into SQLite, with indexes on submission and
+# decision dates and Categories, and an FTS5 index over Description,
+# Property_Address and Applicant. Also a small query CLI:
+#   python query_store.py --db das.sqlite "dual occupancy" "worrigee" --decision Approved --decided-from 01/01/2026
+#   python query_store.py --db das.sqlite --import results.csv
+
+import argparse
+import csv
+import json
+import sqlite3
+import sys
+import time
+
+from job_store import record_fingerprint
+from parquet_store import parse_au_date
+
+
+# The 12 CSV columns, in output order
+COLUMNS = [
+    "DA_Number", "Detail_URL", "Description", "Submitted_Date", "Decision", "Categories",
+    "Property_Address", "Applicant", "Progress", "Fees", "Documents", "Contact_Council",
+]
+TEXT_COLUMNS = ["Description", "Property_Address", "Applicant"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS das (
+    id               INTEGER PRIMARY KEY,
+    DA_Number        TEXT NOT NULL UNIQUE,
+    Detail_URL       TEXT,
+    Description      TEXT,
+    Submitted_Date   TEXT,
+    Decision         TEXT COLLATE NOCASE,
+    Categories       TEXT COLLATE NOCASE,
+    Property_Address TEXT,
+    Applicant        TEXT,
+    Progress         TEXT,
+    Fees             TEXT,
+    Documents        TEXT,
+    Contact_Council  TEXT,
+    submitted_on     TEXT,
+    decided_on       TEXT,
+    fingerprint      TEXT NOT NULL,
+    updated_at       REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS das_submitted ON das (submitted_on);
+CREATE INDEX IF NOT EXISTS das_decided ON das (decided_on);
+CREATE INDEX IF NOT EXISTS das_categories ON das (Categories);
+"""
+
+# External-content FTS5 table kept in step with `das` by triggers
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS das_fts USING fts5(
+    Description, Property_Address, Applicant, content='das', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS das_fts_insert AFTER INSERT ON das BEGIN
+    INSERT INTO das_fts (rowid, Description, Property_Address, Applicant)
+    VALUES (new.id, new.Description, new.Property_Address, new.Applicant);
+END;
+CREATE TRIGGER IF NOT EXISTS das_fts_delete AFTER DELETE ON das BEGIN
+    INSERT INTO das_fts (das_fts, rowid, Description, Property_Address, Applicant)
+    VALUES ('delete', old.id, old.Description, old.Property_Address, old.Applicant);
+END;
+CREATE TRIGGER IF NOT EXISTS das_fts_update AFTER UPDATE ON das BEGIN
+    INSERT INTO das_fts (das_fts, rowid, Description, Property_Address, Applicant)
+    VALUES ('delete', old.id, old.Description, old.Property_Address, old.Applicant);
+    INSERT INTO das_fts (rowid, Description, Property_Address, Applicant)
+    VALUES (new.id, new.Description, new.Property_Address, new.Applicant);
+END;
+"""
+
+# Derived date columns, kept whenever their source column is written
+DATE_COLUMNS = {"Submitted_Date": "submitted_on", "Decision": "decided_on"}
+
+
+def upsert_sql(columns):
+    """INSERT ... ON CONFLICT (DA_Number) DO UPDATE for the given stored columns."""
+    return (
+        f"INSERT INTO das ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)}) "
+        "ON CONFLICT (DA_Number) DO UPDATE SET "
+        + ", ".join(f"{column} = excluded.{column}" for column in columns[1:])
+        # Unchanged records are left alone, so the FTS index is not rewritten
+        + " WHERE das.fingerprint != excluded.fingerprint"
+    )
+
+
+def iso_date(text):
+    """'YYYY-MM-DD' for the first dd/mm/yyyy in text, or None."""
+    parsed = parse_au_date(text)
+    return parsed.isoformat() if parsed else None
+
+
+def fts_query(text):
+    """
+    FTS5 MATCH expression for free text: every word must match, as a quoted
+    token (so '/' or '-' in DA numbers and addresses is not FTS syntax); a
+    trailing * keeps prefix matching.
+    """
+    terms = []
+    for word in text.split():
+        prefix = word.endswith("*")
+        word = word.rstrip("*")
+        if word:
+            terms.append('"' + word.replace('"', '""') + '"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+def _row_dict(row):
+    # Columns a projected run never wrote are NULL
+    return {key: row[key] or "" for key in row.keys()}
+
+
+class QueryStore:
+    """
+    SQLite table of the latest record per DA, for fast local queries.
+    write() buffers upserts and commits every batch_size records and on
+    close(); same write/close interface as CsvRecordWriter. With `fields`
+    (a projection) only those columns are written, so a narrow run never
+    blanks columns that a full run stored earlier.
+    """
+
+    def __init__(self, path, batch_size=500, fields=None):
+        self.path = path
+        self.batch_size = batch_size
+        self.fields = [column for column in COLUMNS
+                       if fields is None or column in fields or column == "DA_Number"]
+        self.dates = [source for source in DATE_COLUMNS if source in self.fields]
+        self._upsert = upsert_sql(
+            self.fields + [DATE_COLUMNS[source] for source in self.dates] + ["fingerprint", "updated_at"]
+        )
+        self.count = 0
+        self._batch = []
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        try:
+            self.conn.executescript(FTS_SCHEMA)
+            self.fts = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5: text search falls back to LIKE scans
+            print("⚠️  SQLite has no FTS5; text queries will scan the table")
+            self.fts = False
+        self.conn.commit()
+
+    # ---------- writing ----------
+
+    def write(self, record):
+        row = [record.get(column) or "" for column in self.fields]
+        row += [iso_date(record.get(source)) for source in self.dates]
+        row += [record_fingerprint(record, self.fields), time.time()]
+        self._batch.append(row)
+        self.count += 1
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self._batch:
+            return
+        with self.conn:
+            self.conn.executemany(self._upsert, self._batch)
+        self._batch = []
+
+    def close(self):
+        if self.conn is None:
+            return
+        self.flush()
+        self.conn.close()
+        self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # ---------- querying ----------
+
+    def search(self, text=None, category=None, decision=None, submitted_from=None, submitted_to=None,
+               decided_from=None, decided_to=None, limit=100):
+        """
+        Records matching every given filter, as dicts in COLUMNS order.
+        text: words that must all appear in Description, Property_Address or
+        Applicant (best matches first). category / decision: case-insensitive
+        prefixes. Dates are dd/mm/yyyy, inclusive.
+        """
+        clauses, params = [], []
+        source = "das"
+        order = "das.submitted_on DESC, das.id DESC"
+
+        if text and self.fts:
+            source = "das_fts JOIN das ON das.id = das_fts.rowid"
+            clauses.append("das_fts MATCH ?")
+            params.append(fts_query(text))
+            order = "das_fts.rank"
+        elif text:
+            for word in text.split():
+                clauses.append("(" + " OR ".join(f"das.{column} LIKE ?" for column in TEXT_COLUMNS) + ")")
+                params += [f"%{word.rstrip('*')}%"] * len(TEXT_COLUMNS)
+
+        for column, prefix in (("Categories", category), ("Decision", decision)):
+            if prefix:
+                clauses.append(f"das.{column} LIKE ? ESCAPE '\\'")
+                params.append(prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%")
+
+        for column, bound, operator in (
+            ("submitted_on", submitted_from, ">="), ("submitted_on", submitted_to, "<="),
+            ("decided_on", decided_from, ">="), ("decided_on", decided_to, "<="),
+        ):
+            if bound:
+                value = iso_date(bound)
+                if value is None:
+                    raise ValueError(f"Expected a dd/mm/yyyy date, got {bound!r}")
+                clauses.append(f"das.{column} {operator} ?")
+                params.append(value)
+
+        sql = f"SELECT {', '.join('das.' + column for column in COLUMNS)} FROM {source}"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {order} LIMIT ?"
+        params.append(limit)
+        return [_row_dict(row) for row in self.conn.execute(sql, params)]
+
+    def get(self, da_number):
+        row = self.conn.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM das WHERE DA_Number = ?", (da_number,)
+        ).fetchone()
+        return _row_dict(row) if row else None
+
+    def stats(self):
+        """(records, oldest submitted_on, newest submitted_on)."""
+        return tuple(self.conn.execute(
+            "SELECT COUNT(*), MIN(submitted_on), MAX(submitted_on) FROM das"
+        ).fetchone())
+
+
+def import_csv(store, path):
+    """Upsert every row of a results CSV; returns the number of rows."""
+    before = store.count
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            store.write(row)
+    store.flush()
+    return store.count - before
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the local DA store")
+    parser.add_argument("text", nargs="*", help="words to find in description, address or applicant")
+    parser.add_argument("--db", default="das.sqlite")
+    parser.add_argument("--import", dest="imports", nargs="+", metavar="CSV", help="load results CSVs first")
+    parser.add_argument("--da", help="show one DA by number")
+    parser.add_argument("--category", help="Categories prefix, e.g. 'Development Application'")
+    parser.add_argument("--decision", help="Decision prefix, e.g. 'Approved'")
+    parser.add_argument("--submitted-from")
+    parser.add_argument("--submitted-to")
+    parser.add_argument("--decided-from")
+    parser.add_argument("--decided-to")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--json", action="store_true", help="print JSON lines instead of a table")
+    args = parser.parse_args(argv)
+
+    with QueryStore(args.db) as store:
+        for path in args.imports or []:
+            print(f"📥 {path}: {import_csv(store, path)} rows upserted")
+
+        if args.da:
+            record = store.get(args.da)
+            print(json.dumps(record, ensure_ascii=False, indent=2) if record else f"❌ {args.da} not found")
+            return
+
+        filters = dict(
+            text=" ".join(args.text), category=args.category, decision=args.decision,
+            submitted_from=args.submitted_from, submitted_to=args.submitted_to,
+            decided_from=args.decided_from, decided_to=args.decided_to,
+        )
+        if args.imports and not any(filters.values()):
+            records, oldest, newest = store.stats()
+            print(f"🗄️  {args.db}: {records} DAs, submitted {oldest} → {newest}")
+            return
+
+        started = time.perf_counter()
+        try:
+            rows = store.search(limit=args.limit, **filters)
+        except (ValueError, sqlite3.OperationalError) as e:
+            print(f"❌ {e}")
+            sys.exit(2)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if args.json:
+        for row in rows:
+            print(json.dumps(row, ensure_ascii=False))
+        return
+    for row in rows:
+        print(f"{row['DA_Number']:<14} {row['Submitted_Date']:<11} {row['Decision'][:28]:<28} "
+              f"{row['Property_Address'][:40]:<40} {row['Description'][:60]}")
+    print(f"\n{len(rows)} result(s) in {elapsed_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
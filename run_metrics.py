@@ -0,0 +1,192 @@
+# Per-stage run metrics for the Shoalhaven DA scraper
+# Counters and latency histograms per stage, exported as a JSON summary and a
+# Prometheus text file, with optional cProfile/tracemalloc hooks per stage.
+
+from contextlib import contextmanager
+import cProfile
+import json
+import math
+import os
+import threading
+import time
+import tracemalloc
+
+
+# Histogram bucket upper bounds in seconds (Prometheus "le" labels)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, math.inf)
+
+
+class RunMetrics:
+    """
+    Thread-safe collector for one run.
+    stage(name) times a block into that stage's histogram; inc(name) bumps a
+    counter. Stages listed in profile_stages are also run under cProfile and
+    tracemalloc (peak bytes per stage).
+    """
+
+    def __init__(self, profile_stages=None, profile_dir="."):
+        self.started_at = time.time()
+        self.counters = {}
+        self.histograms = {}
+        self.memory_peaks = {}
+        self.profilers = {}
+        self.profile_stages = set(profile_stages or ())
+        self.profile_dir = profile_dir
+        self._lock = threading.Lock()
+        self._profiling = threading.local()
+
+    def configure_profiling(self, stages, profile_dir="."):
+        self.profile_stages = set(stages or ())
+        self.profile_dir = profile_dir
+
+    # ---------- recording ----------
+
+    def inc(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            hist = self.histograms.get(stage)
+            if hist is None:
+                hist = {"count": 0, "sum": 0.0, "max": 0.0, "buckets": [0] * len(BUCKETS)}
+                self.histograms[stage] = hist
+            hist["count"] += 1
+            hist["sum"] += seconds
+            hist["max"] = max(hist["max"], seconds)
+            for i, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    hist["buckets"][i] += 1
+                    break
+
+    @contextmanager
+    def stage(self, name):
+        """Time the enclosed block as one observation of `name`."""
+        profiler = self._start_profile(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+            if profiler is not None:
+                self._stop_profile(name, profiler)
+
+    # ---------- profiling hooks ----------
+
+    def _start_profile(self, name):
+        # One profiled stage at a time per thread; nested ones are timed only
+        if name not in self.profile_stages or getattr(self._profiling, "active", False):
+            return None
+        self._profiling.active = True
+
+        with self._lock:
+            profiler = self.profilers.setdefault(name, cProfile.Profile())
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        profiler.enable()
+        return profiler
+
+    def _stop_profile(self, name, profiler):
+        profiler.disable()
+        _, peak = tracemalloc.get_traced_memory()
+        with self._lock:
+            self.memory_peaks[name] = max(self.memory_peaks.get(name, 0), peak)
+        self._profiling.active = False
+
+    def dump_profiles(self):
+        """Write profile_<stage>.prof for every profiled stage; returns the paths."""
+        paths = []
+        for name, profiler in self.profilers.items():
+            os.makedirs(self.profile_dir, exist_ok=True)
+            path = os.path.join(self.profile_dir, f"profile_{name}.prof")
+            profiler.dump_stats(path)
+            paths.append(path)
+        return paths
+
+    # ---------- export ----------
+
+    @staticmethod
+    def _quantile(hist, q):
+        """Upper bucket bound containing the q-quantile (histogram estimate)."""
+        target = q * hist["count"]
+        seen = 0
+        for bound, count in zip(BUCKETS, hist["buckets"]):
+            seen += count
+            if seen >= target:
+                return min(bound, hist["max"])
+        return hist["max"]
+
+    def summary(self):
+        with self._lock:
+            stages = {
+                name: {
+                    "count": hist["count"],
+                    "total_seconds": round(hist["sum"], 6),
+                    "mean_seconds": round(hist["sum"] / hist["count"], 6) if hist["count"] else 0,
+                    "max_seconds": round(hist["max"], 6),
+                    "p50_seconds": self._quantile(hist, 0.5),
+                    "p99_seconds": self._quantile(hist, 0.99),
+                    "buckets": {
+                        ("+Inf" if bound == math.inf else str(bound)): count
+                        for bound, count in zip(BUCKETS, hist["buckets"])
+                    },
+                }
+                for name, hist in self.histograms.items()
+            }
+            return {
+                "started_at": self.started_at,
+                "duration_seconds": round(time.time() - self.started_at, 3),
+                "counters": dict(self.counters),
+                "stages": stages,
+                "memory_peak_bytes": dict(self.memory_peaks),
+            }
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def write_prometheus(self, path, prefix="shoalhaven_scraper"):
+        lines = []
+        with self._lock:
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"# TYPE {prefix}_{name}_total counter")
+                lines.append(f"{prefix}_{name}_total {value}")
+
+            lines.append(f"# TYPE {prefix}_stage_seconds histogram")
+            for name, hist in sorted(self.histograms.items()):
+                cumulative = 0
+                for bound, count in zip(BUCKETS, hist["buckets"]):
+                    cumulative += count
+                    le = "+Inf" if bound == math.inf else str(bound)
+                    lines.append(f'{prefix}_stage_seconds_bucket{{stage="{name}",le="{le}"}} {cumulative}')
+                lines.append(f'{prefix}_stage_seconds_sum{{stage="{name}"}} {hist["sum"]:.6f}')
+                lines.append(f'{prefix}_stage_seconds_count{{stage="{name}"}} {hist["count"]}')
+
+            if self.memory_peaks:
+                lines.append(f"# TYPE {prefix}_stage_memory_peak_bytes gauge")
+                for name, peak in sorted(self.memory_peaks.items()):
+                    lines.append(f'{prefix}_stage_memory_peak_bytes{{stage="{name}"}} {peak}')
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def print_report(self):
+        summary = self.summary()
+        if not summary["stages"]:
+            return
+
+        print("\n" + "=" * 70)
+        print("📈 Stage Metrics")
+        print("=" * 70)
+        print(f"   {'Stage':<22}{'Count':>7}{'Total s':>10}{'Mean s':>9}{'p99 s':>8}{'Max s':>8}")
+        for name, stage in summary["stages"].items():
+            print(f"   {name:<22}{stage['count']:>7}{stage['total_seconds']:>10.2f}"
+                  f"{stage['mean_seconds']:>9.3f}{stage['p99_seconds']:>8.2f}{stage['max_seconds']:>8.2f}")
+        if summary["counters"]:
+            print("   " + ", ".join(f"{k}={v}" for k, v in sorted(summary["counters"].items())))
+        print("=" * 70 + "\n")
+
+
+# Process-wide collector used by the scraper
+metrics = RunMetrics()
@@ -0,0 +1,372 @@
+# Scraper daemon: warm browsers behind a local job API
+# Keeps DAEMON_BROWSERS Chrome sessions parked on the Advanced Search panel
+# (steps 1-3 already done), so a job only pays for steps 4-7:
+#   POST /jobs               {"start": "01/10/2025", "end": "01/10/2025", "output": "oct.csv"}
+#   GET  /jobs, /jobs/<id>   job status
+#   GET  /jobs/<id>/results  records as JSON lines, streamed while the job runs
+#   GET  /health             warm browsers and queued jobs
+# Usage: python scrape_daemon.py --port 8765 --browsers 2
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from datetime import datetime
+import argparse
+import itertools
+import json
+import os
+import queue
+import threading
+import time
+import traceback
+
+import shoalhaven_da_scraper as scraper
+from run_metrics import metrics
+
+
+DAEMON_HOST = "127.0.0.1"       # local only: the API has no authentication
+DAEMON_PORT = 8765
+DAEMON_BROWSERS = 2
+DAEMON_ENGINE = "http"          # detail engine for jobs, see DETAIL_ENGINE
+DAEMON_OUTPUT_DIR = "daemon_output"
+JOB_HISTORY = 50                # finished jobs (and their records) kept in memory
+REWARM_DELAY = 30               # seconds between attempts to restart a broken browser
+
+
+class Job:
+    """One date-range scrape. Records stay in memory for streaming until evicted."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, start_date, end_date, output=None):
+        self.id = str(next(Job._ids))
+        self.start_date = start_date
+        self.end_date = end_date
+        self.output = output
+        self.status = "queued"
+        self.error = None
+        self.total_items = None
+        self.failed = 0
+        self.records = []
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._changed = threading.Condition()
+
+    @property
+    def finished(self):
+        return self.status in ("done", "failed")
+
+    def add_record(self, record):
+        with self._changed:
+            self.records.append(record)
+            self._changed.notify_all()
+
+    def start(self):
+        with self._changed:
+            self.status = "running"
+            self.started_at = time.time()
+            self._changed.notify_all()
+
+    def finish(self, status, error=None):
+        with self._changed:
+            self.status = status
+            self.error = error
+            self.finished_at = time.time()
+            self._changed.notify_all()
+
+    def follow(self):
+        """Yield every record, waiting for new ones until the job has finished."""
+        index = 0
+        while True:
+            with self._changed:
+                while index >= len(self.records) and not self.finished:
+                    self._changed.wait(1.0)
+                batch = self.records[index:]
+                finished = self.finished
+            index += len(batch)
+            yield from batch
+            if finished and index >= len(self.records):
+                return
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "start": self.start_date,
+            "end": self.end_date,
+            "output": self.output,
+            "status": self.status,
+            "error": self.error,
+            "total_items": self.total_items,
+            "records": len(self.records),
+            "failed": self.failed,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class WarmBrowser:
+    """One Chrome session that is parked on Advanced Search between jobs."""
+
+    def __init__(self, slot):
+        self.slot = slot
+        self.driver = None
+
+    def warm(self):
+        """
+        Start Chrome if needed and run steps 1-3; False (browser closed) on
+        failure. A browser that is already running skips the disclaimer wait.
+        """
+        try:
+            started = self.driver is not None
+            if not started:
+                self.driver = scraper.create_driver(profile=f"daemon-{self.slot}")
+            if scraper.open_advanced_search(self.driver, disclaimer_accepted=started):
+                return True
+        except Exception as e:
+            print(f"⚠️  Browser {self.slot} failed to warm up: {type(e).__name__}: {e}")
+        self.quit()
+        return False
+
+    def quit(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+
+
+class ScrapeDaemon:
+    """
+    Job queue served by one worker thread per warm browser. A browser goes
+    back to Advanced Search after every job, before it takes the next one.
+    """
+
+    def __init__(self, browsers=None, engine=None, output_dir=None):
+        self.engine = engine or DAEMON_ENGINE
+        self.output_dir = output_dir or DAEMON_OUTPUT_DIR
+        self.browsers = [WarmBrowser(slot) for slot in range(browsers or DAEMON_BROWSERS)]
+        # Every browser's jobs hit the same site: one rate budget and circuit
+        # breaker for all of them, with room for each browser's engine
+        per_job = {"async": scraper.DETAIL_CONCURRENCY, "tabs": scraper.TAB_COUNT}.get(self.engine, 1)
+        self.controller = scraper.create_fetch_controller(concurrency=per_job * len(self.browsers))
+        self.jobs = {}
+        self.ready = 0
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._threads = []
+
+    def start(self):
+        for browser in self.browsers:
+            thread = threading.Thread(target=self._worker, args=(browser,), daemon=True,
+                                      name=f"browser-{browser.slot}")
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout=None):
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+
+    # ---------- jobs ----------
+
+    def submit(self, start_date, end_date=None, output=None):
+        """
+        Queue a job; ValueError for bad dates, an output that is not a plain
+        file name, or one that a queued or running job is still writing.
+        """
+        end_date = end_date or start_date
+        for value in (start_date, end_date):
+            datetime.strptime(value or "", scraper.DATE_FORMAT)
+        if output and (os.path.basename(output) != output or not output.endswith(".csv")):
+            raise ValueError("output must be a .csv file name")
+
+        job = Job(start_date, end_date, os.path.join(self.output_dir, output) if output else None)
+        with self._lock:
+            if job.output and any(old.output == job.output and not old.finished for old in self.jobs.values()):
+                raise ValueError(f"output {output} is in use by an unfinished job")
+            self.jobs[job.id] = job
+            finished = [old.id for old in self.jobs.values() if old.finished]
+            for old_id in finished[:max(0, len(finished) - JOB_HISTORY)]:
+                del self.jobs[old_id]
+        self._queue.put(job)
+        print(f"📥 Job {job.id}: {start_date} → {end_date}")
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def list_jobs(self):
+        with self._lock:
+            return [job.to_dict() for job in self.jobs.values()]
+
+    def health(self):
+        with self._lock:
+            return {"browsers": len(self.browsers), "warm": self.ready,
+                    "queued": self._queue.qsize(), "engine": self.engine}
+
+    # ---------- workers ----------
+
+    def _worker(self, browser):
+        while True:
+            while not browser.warm():
+                time.sleep(REWARM_DELAY)
+            with self._lock:
+                self.ready += 1
+            print(f"🔥 Browser {browser.slot} ready on Advanced Search")
+
+            job = self._queue.get()
+            with self._lock:
+                self.ready -= 1
+            if job is None:
+                browser.quit()
+                return
+            self._run(browser, job)
+
+    def _run(self, browser, job):
+        job.start()
+        driver = browser.driver
+        try:
+            with metrics.stage("daemon_job"):
+                opened = scraper.search_date_range(driver, job.start_date, job.end_date)
+                if opened is None:
+                    raise RuntimeError("search failed")
+                job.total_items, total_pages = opened
+                items = scraper.collect_search_results(driver, total_pages) if total_pages else []
+                items = scraper.dedupe_da_url_list(items)
+
+                if job.output:
+                    os.makedirs(self.output_dir, exist_ok=True)
+                writer = scraper.CsvRecordWriter(job.output) if job.output else None
+
+                def on_record(item, record):
+                    if writer is not None:
+                        writer.write(record)
+                    job.add_record(record)
+
+                def on_failure(item, error):
+                    job.failed += 1
+
+                try:
+                    results = scraper.iter_detail_results(driver, items, self.engine, self.controller)
+                    scraper.consume_detail_results(results, len(items), on_record, on_failure,
+                                                   keep_records=False)
+                finally:
+                    if writer is not None:
+                        writer.close()
+            job.finish("done")
+            print(f"✅ Job {job.id}: {len(job.records)} records, {job.failed} failed "
+                  f"in {job.finished_at - job.started_at:.1f}s")
+        except Exception as e:
+            traceback.print_exc()
+            job.finish("failed", f"{type(e).__name__}: {e}")
+            print(f"❌ Job {job.id} failed: {job.error}")
+            # Page state is unknown: start this slot over with a fresh browser
+            browser.quit()
+
+
+# ==================== HTTP API ====================
+
+class JobApiHandler(BaseHTTPRequestHandler):
+    """JSON job API; the ScrapeDaemon is server.scrape_daemon."""
+
+    def _send_json(self, status, body):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _parts(self):
+        return [part for part in self.path.split("?", 1)[0].split("/") if part]
+
+    def do_POST(self):
+        if self._parts() != ["jobs"]:
+            self._send_json(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            job = self.server.scrape_daemon.submit(payload.get("start"), payload.get("end"),
+                                                   payload.get("output"))
+        except (ValueError, TypeError, AttributeError) as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        self._send_json(202, job.to_dict())
+
+    def do_GET(self):
+        daemon = self.server.scrape_daemon
+        parts = self._parts()
+        if parts == ["health"]:
+            self._send_json(200, daemon.health())
+            return
+        if parts == ["jobs"]:
+            self._send_json(200, daemon.list_jobs())
+            return
+
+        job = daemon.get(parts[1]) if len(parts) in (2, 3) and parts[0] == "jobs" else None
+        if job is None or (len(parts) == 3 and parts[2] != "results"):
+            self._send_json(404, {"error": "not found"})
+        elif len(parts) == 2:
+            self._send_json(200, job.to_dict())
+        else:
+            self._stream_results(job)
+
+    def _stream_results(self, job):
+        # HTTP/1.0: the response ends when the connection closes
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        try:
+            headers = scraper.output_headers()
+            for record in job.follow():
+                row = {header: record.get(header) or "" for header in headers}
+                self.wfile.write((json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        print(f"🌐 {self.address_string()} {format % args}")
+
+
+def serve(daemon, host=None, port=None):
+    """Start the browser workers and serve the API until interrupted."""
+    server = ThreadingHTTPServer((host or DAEMON_HOST, port or DAEMON_PORT), JobApiHandler)
+    server.scrape_daemon = daemon
+    daemon.start()
+
+    print("\n" + "=" * 70)
+    print(f"🛰️  Scraper daemon on http://{server.server_address[0]}:{server.server_address[1]}")
+    print(f"   Browsers: {len(daemon.browsers)} | Detail engine: {daemon.engine}")
+    print("=" * 70 + "\n")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Shutting down")
+    finally:
+        server.server_close()
+        daemon.stop(timeout=scraper.WAIT_TIME)
+        scraper.report_fetch_control(daemon.controller)
+        scraper.export_metrics()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm-browser scraper daemon with a local job API")
+    parser.add_argument("--host", default=DAEMON_HOST)
+    parser.add_argument("--port", type=int, default=DAEMON_PORT)
+    parser.add_argument("--browsers", type=int, default=DAEMON_BROWSERS)
+    parser.add_argument("--engine", default=DAEMON_ENGINE,
+                        choices=["selenium", "http", "async", "pool", "tabs"])
+    parser.add_argument("--output-dir", default=DAEMON_OUTPUT_DIR)
+    args = parser.parse_args()
+
+    metrics.configure_profiling(scraper.PROFILE_STAGES, scraper.PROFILE_DIR)
+    serve(ScrapeDaemon(args.browsers, args.engine, args.output_dir), args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
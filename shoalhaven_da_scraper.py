@@ -1,6 +1,6 @@
 # Shoalhaven DA Tracking Web Scraper - FINAL COMPLETE VERSION
 # Collects DA + Full URLs, then scrapes sequentially with cleaning rules
-# Install dependencies: pip install selenium webdriver-manager beautifulsoup4 pandas
+# Install dependencies: pip install selenium webdriver-manager requests lxml
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -11,16 +11,46 @@ from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException, 
     StaleElementReferenceException,
-    InvalidArgumentException
+    JavascriptException
 )
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import deque
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit
+import multiprocessing as mp
+import csv
+import os
+import threading
+import queue
+import requests
+import asyncio
+import json
 import time
 import re
 
+from compact_record import CompactRecord
+from document_store import DocumentDownloader, DocumentStore
+from fetch_control import FetchController, backoff_delay
+from job_store import JobStore, range_key
+from page_cache import PageCache
+from parquet_store import ParquetRecordWriter
+from query_store import QueryStore
+from run_metrics import metrics
+from detail_parser import (
+    DETAIL_SECTION_IDS,
+    DOCUMENTS_SECTION_ID,
+    parse_detail_page,
+    parse_grid_rows,
+    parse_grid_summaries,
+    parse_results_page,
+    parse_total_pages_and_items,
+    site_section_ids,
+)
+
 
 # ==================== CONFIGURATION ====================
 START_DATE = "01/09/2025"
@@ -28,8 +58,124 @@ END_DATE = "30/09/2025"
 BASE_URL = "https://www3.shoalhaven.nsw.gov.au/masterviewUI/modules/ApplicationMaster/Default.aspx"
 BASE_APP = "https://www3.shoalhaven.nsw.gov.au/masterviewUI/modules/ApplicationMaster/"
 BASE_ROOT = "https://www3.shoalhaven.nsw.gov.au"
+TRACKING_LINK_TEXT = "DA Tracking"   # menu entry opened in STEP 2
 OUTPUT_CSV = "results.csv"
+# Output columns (None = all HEADERS). Only the detail sections they need are
+# parsed, and "Expand All" is skipped when those are always visible, e.g.
+# FIELDS = ["DA_Number", "Description", "Decision"]
+FIELDS = None
 WAIT_TIME = 20
+
+# Optional Parquet dataset written alongside the CSV (needs pyarrow), one
+# submitted_month=YYYY-MM partition per month, new files appended every run
+PARQUET_DIR = None
+PARQUET_ROWS_PER_FILE = 50000
+
+# Optional SQLite query store (query_store.py): records upserted by DA_Number
+# with date/category indexes and full-text search, for fast local queries
+QUERY_DB = None
+
+# Download every lblDocs document into DOCUMENTS_DIR (None disables), with
+# DOCUMENT_WORKERS concurrent transfers; identical files are stored once
+DOCUMENTS_DIR = None
+DOCUMENT_WORKERS = 4
+
+# Pipelined mode: start fetching detail pages (over HTTP, DETAIL_CONCURRENCY
+# workers) while the browser is still paging through the grid. At most
+# PIPELINE_QUEUE_SIZE DAs wait between the two stages.
+PIPELINE = False
+PIPELINE_QUEUE_SIZE = 100
+
+# "full" scrapes every detail page. "summary" writes every results-grid
+# column to SUMMARY_CSV as each page is read, then fetches detail pages
+# (into OUTPUT_CSV) only for rows where ENRICH_FILTER(summary) is true,
+# e.g. lambda row: "Dual Occupancy" in row.get("Description", "")
+SCRAPE_MODE = "full"
+SUMMARY_CSV = "summary.csv"
+ENRICH_FILTER = None
+
+# Incremental runs (needs JOB_STORE_PATH): a DA whose Decision was final when
+# last checked less than INCREMENTAL_MAX_AGE_DAYS ago reuses its stored record
+# instead of being fetched. New and changed records are appended to
+# CHANGE_FEED as JSON lines; OUTPUT_CSV remains the full snapshot.
+INCREMENTAL = False
+INCREMENTAL_MAX_AGE_DAYS = 30
+CHANGE_FEED = "changes.jsonl"
+
+# Chrome profile: headless, no images/stylesheets/fonts, and driver.get()
+# returns at DOMContentLoaded ("eager") instead of waiting for every resource.
+# CHROMEDRIVER_PATH skips ChromeDriverManager's network lookup (it is also
+# resolved once and reused); each browser keeps a warm on-disk profile under
+# CHROME_PROFILE_DIR (None = fresh temporary profile every launch)
+HEADLESS = True
+BLOCK_RESOURCES = True
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico", "*.webp",
+    "*.css", "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+]
+PAGE_LOAD_STRATEGY = "eager"
+CHROMEDRIVER_PATH = None
+CHROME_PROFILE_DIR = "chrome_profile"
+
+# Detail-page engine: "selenium" (drive Chrome per record),
+# "http" (reuse the browser's session cookies with a pooled HTTP client) or
+# "async" (same as "http" but DETAIL_CONCURRENCY requests in flight) or
+# "pool" (POOL_WORKERS Chrome processes, each with its own session) or
+# "tabs" (TAB_COUNT tabs in the one Chrome, sharing its session)
+DETAIL_ENGINE = "selenium"
+HTTP_TIMEOUT = 30
+HTTP_POOL_SIZE = 10
+DETAIL_CONCURRENCY = 8
+MAX_REQUESTS_PER_SECOND = 5.0   # per host ceiling, see fetch control below
+POOL_WORKERS = 4
+POOL_SHARD_SIZE = 10            # DAs handed to a worker at a time
+POOL_HEADLESS = True
+TAB_COUNT = 4
+TAB_LOAD_TIMEOUT = 30           # seconds before a tab's navigation counts as failed
+
+# Fetch control (every engine): transient failures (timeouts, connection
+# errors, 408/429/5xx) are retried up to FETCH_MAX_ATTEMPTS times with
+# jittered exponential backoff. Rate and concurrency back off (AIMD) on errors
+# or responses slower than LATENCY_TARGET and creep back up to the limits
+# above. BREAKER_THRESHOLD consecutive failures pause all fetches for
+# BREAKER_COOLDOWN seconds.
+FETCH_MAX_ATTEMPTS = 4
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 60.0
+MIN_REQUESTS_PER_SECOND = 0.5
+LATENCY_TARGET = 5.0
+BREAKER_THRESHOLD = 10
+BREAKER_COOLDOWN = 60.0
+
+# Result collection: "browser" (click rgPageNext in Chrome) or
+# "postback" (replay the grid's ASP.NET postbacks over HTTP)
+COLLECTOR = "browser"
+GRID_PAGE_SIZES = [500, 250, 100, 50]   # tried largest first
+
+# SQLite checkpoint file; rerunning the same date range resumes pending/failed
+# DAs only. Set to None to keep everything in memory.
+JOB_STORE_PATH = "scrape_jobs.sqlite"
+
+# Backfill mode: split START_DATE..END_DATE into windows ("week", "month" or a
+# number of days), each searched in its own browser session in parallel.
+# None runs one search over the whole range.
+BACKFILL_WINDOW = None
+BACKFILL_WORKERS = 4
+
+# Compressed on-disk cache of raw detail pages (None disables). With
+# REPLAY_FROM_CACHE the CSV is rebuilt from cached pages with no network.
+PAGE_CACHE_DIR = None
+PAGE_CACHE_TTL = 7 * 24 * 3600          # seconds before a page is re-fetched
+PAGE_CACHE_MAX_BYTES = 2 * 1024 ** 3    # evicted oldest-first above this
+REPLAY_FROM_CACHE = False
+
+# Per-stage timings/counters written after every run (None disables a file).
+# Stages named in PROFILE_STAGES (e.g. "record_parse") also run under
+# cProfile + tracemalloc; profiles land in PROFILE_DIR as profile_<stage>.prof
+METRICS_JSON = "run_metrics.json"
+METRICS_PROM = "run_metrics.prom"
+PROFILE_STAGES = []
+PROFILE_DIR = "profiles"
 # =====================================================
 
 
@@ -38,6 +184,15 @@ FEES_NO_FEES_TEXT = "No fees recorded against this application."
 CONTACT_NO_EXHIBITION_TEXT = "Application Is Not on exhibition, please call Council on 1300 293 111 if you require assistance."
 
 
+# Leftover <a> markup in the Properties text
+ANCHOR_TAG_RE = re.compile(r'<a[^>]*>(.*?)</a>')
+
+# Decisions that will not change again (e.g. "Approved on 01/09/2025")
+FINAL_DECISION_RE = re.compile(
+    r"^\s*(Approved|Refused|Withdrawn|Determined|Rejected|Cancelled|Lapsed)\b", re.IGNORECASE
+)
+
+
 # CSV headers (EXACT order and spelling)
 HEADERS = [
     "DA_Number",
@@ -54,11 +209,47 @@ HEADERS = [
     "Contact_Council",
 ]
 
+# Detail section (div ID) each column is read from; DA_Number and
+# Detail_URL come from the page itself
+FIELD_SECTIONS = {
+    "Description": "lblDetails",
+    "Submitted_Date": "lblDetails",
+    "Decision": "lblDecision",
+    "Categories": "lblCat",
+    "Property_Address": "lblProp",
+    "Applicant": "lblPeople",
+    "Progress": "lblProg",
+    "Fees": "lblFees",
+    "Documents": "lblDocs",
+    "Contact_Council": "lbl91",
+}
+# Sections shown without clicking "Expand All"
+ALWAYS_VISIBLE_SECTIONS = {"lblDetails", "lblDecision"}
+
 
 # ==================== DRIVER INITIALIZATION ====================
 
-def create_driver(headless=False):
-    """Create and configure Chrome WebDriver."""
+def chromedriver_path():
+    """
+    Path to the chromedriver binary, resolved at most once.
+    The result is exported as CHROMEDRIVER_PATH in the environment so spawned
+    pool/backfill workers reuse it instead of asking ChromeDriverManager again.
+    """
+    global CHROMEDRIVER_PATH
+    if not CHROMEDRIVER_PATH:
+        CHROMEDRIVER_PATH = os.environ.get("CHROMEDRIVER_PATH") or ChromeDriverManager().install()
+        os.environ["CHROMEDRIVER_PATH"] = CHROMEDRIVER_PATH
+    return CHROMEDRIVER_PATH
+
+
+def create_driver(headless=None, profile="main"):
+    """
+    Create and configure Chrome WebDriver.
+    headless defaults to HEADLESS. `profile` names the warm user-data-dir
+    under CHROME_PROFILE_DIR; Chrome locks a profile per process, so
+    concurrent browsers must each pass a distinct name.
+    """
+    headless = HEADLESS if headless is None else headless
     options = Options()
     if headless:
         options.add_argument("--headless=new")
@@ -67,13 +258,134 @@ def create_driver(headless=False):
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1920,1080")
     options.add_argument("--start-maximized")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--no-first-run")
+    options.add_argument("--disable-background-networking")
+    options.page_load_strategy = PAGE_LOAD_STRATEGY
+    
+    if BLOCK_RESOURCES:
+        # Images via content settings; stylesheets/fonts via CDP below
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+        })
+    
+    if CHROME_PROFILE_DIR and profile:
+        profile_dir = os.path.abspath(os.path.join(CHROME_PROFILE_DIR, profile))
+        os.makedirs(profile_dir, exist_ok=True)
+        options.add_argument(f"--user-data-dir={profile_dir}")
 
-    service = ChromeService(ChromeDriverManager().install())
+    service = ChromeService(chromedriver_path())
     driver = webdriver.Chrome(service=service, options=options)
     driver.set_page_load_timeout(60)
+    
+    if BLOCK_RESOURCES:
+        block_resources(driver)
     return driver
 
 
+def block_resources(driver):
+    """
+    Block BLOCKED_URL_PATTERNS via CDP. The setting belongs to the current
+    tab, so every tab opened later needs its own call.
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        print(f"⚠️  Resource blocking unavailable: {e}")
+
+
+# ==================== WAIT LAYER ====================
+
+# Seconds actually spent in each labelled wait, for the end-of-run report
+WAIT_TIMINGS = {}
+
+def wait_for(driver, condition, label, timeout=None, required=True):
+    """
+    Poll condition(driver) until it returns something truthy and return it.
+    The elapsed time is recorded under `label` whether or not it succeeded.
+    With required=False a timeout returns None instead of raising.
+    """
+    start = time.perf_counter()
+    try:
+        return WebDriverWait(
+            driver,
+            timeout or WAIT_TIME,
+            poll_frequency=0.1,
+            ignored_exceptions=(NoSuchElementException, StaleElementReferenceException, JavascriptException),
+        ).until(condition)
+    except TimeoutException:
+        if required:
+            raise
+        return None
+    finally:
+        elapsed = time.perf_counter() - start
+        WAIT_TIMINGS.setdefault(label, []).append(elapsed)
+        metrics.observe(f"wait_{label}", elapsed)
+
+
+def ajax_idle(driver):
+    """Condition: document loaded and no ASP.NET AJAX / Telerik postback in flight."""
+    return driver.execute_script(
+        "if (document.readyState !== 'complete') return false;"
+        "if (typeof Sys !== 'undefined' && Sys.WebForms && Sys.WebForms.PageRequestManager) {"
+        "  var prm = Sys.WebForms.PageRequestManager.getInstance();"
+        "  if (prm && prm.get_isInAsyncPostBack()) return false;"
+        "}"
+        "if (typeof jQuery !== 'undefined' && jQuery.active) return false;"
+        "return true;"
+    )
+
+
+def grid_signature(driver):
+    """DA number in the first data row of the results grid (None if no grid)."""
+    return driver.execute_script(
+        "var cell = document.querySelector('table.rgMasterTable > tbody > tr > td:nth-child(2)');"
+        "return cell ? cell.textContent.trim() : null;"
+    )
+
+
+def grid_rows_changed(previous_signature):
+    """Condition factory: the grid shows different rows and the postback finished."""
+    def condition(driver):
+        signature = grid_signature(driver)
+        return signature is not None and signature != previous_signature and ajax_idle(driver)
+    return condition
+
+
+def details_present(driver):
+    """Condition: detail page content rendered, including lblDetails."""
+    return bool(driver.find_elements(By.ID, "lblDetails")) or bool(
+        driver.find_elements(By.XPATH, "//div[contains(@class, 'makeTableRow_Content')]")
+    )
+
+
+def sections_expanded(driver, section_ids=None):
+    """Condition: every given (default: every) detail section on the page is displayed."""
+    return driver.execute_script(
+        "return arguments[0].every(function (id) {"
+        "  var el = document.getElementById(id);"
+        "  return !el || el.offsetParent !== null;"
+        "});",
+        site_section_ids(section_ids),
+    )
+
+
+def print_wait_report():
+    """Print how long each labelled wait actually took."""
+    if not WAIT_TIMINGS:
+        return
+    
+    print("\n" + "="*70)
+    print("⏱️  Wait Timing Report")
+    print("="*70)
+    print(f"   {'Wait':<28}{'Count':>7}{'Total s':>10}{'Mean s':>9}{'Max s':>8}")
+    for label, samples in WAIT_TIMINGS.items():
+        total = sum(samples)
+        print(f"   {label:<28}{len(samples):>7}{total:>10.2f}{total/len(samples):>9.2f}{max(samples):>8.2f}")
+    print("="*70 + "\n")
+
+
 # ==================== STEPS 1-4: SETUP & SEARCH ====================
 
 def step_1_accept_disclaimer(driver):
@@ -90,7 +402,8 @@ def step_1_accept_disclaimer(driver):
             EC.element_to_be_clickable((By.XPATH, "//input[@value='Agree']"))
         )
         agree_btn.click()
-        time.sleep(2)
+        wait_for(driver, EC.staleness_of(agree_btn), "step_1_disclaimer", timeout=5, required=False)
+        wait_for(driver, ajax_idle, "step_1_disclaimer")
         print("✅ Clicked 'Agree' button")
         return True
     except Exception as e:
@@ -98,6 +411,18 @@ def step_1_accept_disclaimer(driver):
         return True
 
 
+def reload_start_page(driver):
+    """
+    STEP 1 for a session that accepted the disclaimer before: reload the start
+    page, and only accept the disclaimer again if it is shown (no waiting for it).
+    """
+    driver.get(BASE_URL)
+    if driver.find_elements(By.XPATH, "//input[@value='Agree']"):
+        return step_1_accept_disclaimer(driver)
+    wait_for(driver, ajax_idle, "step_1_reload")
+    return True
+
+
 def step_2_navigate_da_tracking(driver):
     """STEP 2: Navigate to DA Tracking module."""
     print("\n" + "="*70)
@@ -108,12 +433,16 @@ def step_2_navigate_da_tracking(driver):
     try:
         da_link = wait.until(
             EC.element_to_be_clickable(
-                (By.XPATH, "//a[.//span[text()='DA Tracking']]")
+                (By.XPATH, f"//a[.//span[text()='{TRACKING_LINK_TEXT}']]")
             )
         )
         da_link.click()
+        wait_for(
+            driver,
+            EC.presence_of_element_located((By.XPATH, "//a[.//span[text()='Advanced Search']]")),
+            "step_2_da_tracking",
+        )
         print("✅ Navigated to DA Tracking")
-        time.sleep(3)
         return True
     except Exception as e:
         print(f"❌ FAILED: {e}")
@@ -128,15 +457,18 @@ def step_3_open_advanced_search(driver):
     
     wait = WebDriverWait(driver, WAIT_TIME)
     try:
-        time.sleep(2)
         adv_search = wait.until(
             EC.element_to_be_clickable(
                 (By.XPATH, "//a[.//span[text()='Advanced Search']]")
             )
         )
         driver.execute_script("arguments[0].click();", adv_search)
+        wait_for(
+            driver,
+            EC.element_to_be_clickable((By.XPATH, "//input[contains(@id,'ctl03_dateInput')]")),
+            "step_3_advanced_search",
+        )
         print("✅ Opened Advanced Search panel")
-        time.sleep(2)
         return True
     except Exception as e:
         print(f"❌ FAILED: {e}")
@@ -151,8 +483,6 @@ def step_4_set_date_range(driver, start_date, end_date):
     
     wait = WebDriverWait(driver, WAIT_TIME)
     try:
-        time.sleep(1)
-        
         from_input = wait.until(
             EC.element_to_be_clickable(
                 (By.XPATH, "//input[contains(@id,'ctl03_dateInput')]")
@@ -164,27 +494,18 @@ def step_4_set_date_range(driver, start_date, end_date):
             )
         )
         
-        # Set FROM date
+        # Set FROM date (send_keys still types one key event per character,
+        # which the Telerik masked input needs, just without pauses)
         from_input.click()
-        time.sleep(0.3)
         from_input.clear()
-        time.sleep(0.3)
-        for char in start_date:
-            from_input.send_keys(char)
-            time.sleep(0.05)
-        from_input.send_keys(Keys.TAB)
-        time.sleep(0.5)
+        from_input.send_keys(start_date, Keys.TAB)
+        wait_for(driver, ajax_idle, "step_4_date_range")
         
         # Set TO date
         to_input.click()
-        time.sleep(0.3)
         to_input.clear()
-        time.sleep(0.3)
-        for char in end_date:
-            to_input.send_keys(char)
-            time.sleep(0.05)
-        to_input.send_keys(Keys.TAB)
-        time.sleep(0.5)
+        to_input.send_keys(end_date, Keys.TAB)
+        wait_for(driver, ajax_idle, "step_4_date_range")
         
         print(f"✅ Date range set: {start_date} → {end_date}")
         return True
@@ -206,16 +527,17 @@ def step_4b_click_search(driver):
             EC.element_to_be_clickable((By.ID, "ctl00_cphContent_ctl00_btnSearch"))
         )
         driver.execute_script("arguments[0].scrollIntoView(true);", search_btn)
-        time.sleep(0.5)
         search_btn.click()
         print("✅ Clicked Search button")
 
-        wait.until(
+        wait_for(
+            driver,
             EC.presence_of_element_located(
                 (By.XPATH, "//table[contains(@class,'rgMasterTable')] | //span[contains(text(),'No records')]")
-            )
+            ),
+            "step_4b_results",
         )
-        time.sleep(2)
+        wait_for(driver, ajax_idle, "step_4b_results")
         print("✅ Results grid loaded")
         return True
 
@@ -229,21 +551,10 @@ def step_4b_click_search(driver):
 def extract_total_pages_and_items(driver):
     """Extract total pages and items from rgInfoPart div."""
     try:
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        info_div = soup.find("div", {"class": re.compile(r"rgWrap.*rgInfoPart")})
-        
-        if not info_div:
+        total_items, total_pages = parse_total_pages_and_items(driver.page_source)
+        if total_pages is None:
             print("⚠️  Could not find rgInfoPart div")
-            return None, None
-        
-        strong_tags = info_div.find_all("strong")
-        
-        if len(strong_tags) >= 2:
-            total_items = int(strong_tags[0].get_text(strip=True))
-            total_pages = int(strong_tags[1].get_text(strip=True))
-            return total_items, total_pages
-        
-        return None, None
+        return total_items, total_pages
     except Exception as e:
         print(f"❌ Error extracting pages: {e}")
         return None, None
@@ -279,28 +590,15 @@ def normalize_url(raw_url):
 
 # ==================== STEP 5: COLLECT DA + FULL URLs ====================
 
-def parse_row_link_href(row):
-    """Extract href value from Show button link."""
-    a = row.find("a")
-    if not a:
-        return None
-    
-    href = (a.get("href") or "").strip()
-    
-    # Skip javascript: links (postbacks)
-    if href.lower().startswith("javascript:"):
-        return None
-    
-    return href
-
-
-def collect_da_and_urls(driver, total_pages):
+def iter_da_and_url_pages(driver, total_pages, with_columns=False):
     """
-    Collect DA numbers and normalized full URLs from all pages.
-    Returns: [{'da': str, 'url': str}, ...]
+    Generator form of collect_da_and_urls: yields each grid page's new
+    [{'da': str, 'url': str}, ...] as soon as it is parsed, before the next
+    page is requested, so consumers can start on it while paging continues.
+    with_columns=True adds 'grid': {column header: text} to every item.
     """
-    results = []
     seen_das = set()  # Track DAs to prevent duplicates
+    collected = 0
     page_num = 1
     
     print("\n" + "="*70)
@@ -312,369 +610,1846 @@ def collect_da_and_urls(driver, total_pages):
         print(f"📄 Page {page_num}/{total_pages}: Collecting...", end=" ")
         
         try:
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-            table = soup.find("table", {"class": re.compile("rgMasterTable")})
+            with metrics.stage("grid_parse"):
+                if with_columns:
+                    rows = parse_grid_summaries(driver.page_source)
+                else:
+                    rows = parse_grid_rows(driver.page_source)
+            metrics.inc("grid_pages")
             
-            if not table:
+            if rows is None:
                 print("⚠️  Table not found")
                 break
             
-            rows = table.find_all("tr")[1:]  # Skip header
-            page_count = 0
+            page_items = []
             
-            for row in rows:
-                cells = row.find_all("td")
-                show_img = row.find("img", {"src": re.compile("GridShowButton\.png")})
-                
-                if not show_img or len(cells) < 2:
-                    continue
-                
-                da = cells[1].get_text(strip=True)
-                
+            for da, href, *columns in rows:
                 # Skip duplicates
                 if da in seen_das:
                     continue
                 
-                href = parse_row_link_href(row)
-                if not href:
-                    continue
-                
                 full_url = normalize_url(href)
                 
-                results.append({
+                item = {
                     "da": da,
                     "url": full_url
-                })
+                }
+                if with_columns:
+                    item["grid"] = columns[0]
+                page_items.append(item)
                 seen_das.add(da)
-                page_count += 1
-            
-            print(f"✅ {page_count} unique (Total: {len(results)})")
             
-            # Stop if last page
-            if page_num == total_pages:
-                print(f"\n{'='*70}")
-                print(f"🛑 Reached last page ({page_num}/{total_pages})")
-                print(f"{'='*70}")
-                print(f"✅ Collection Complete: {len(results)} unique DAs")
-                print(f"{'='*70}\n")
-                break
-            
-            # Go to next page
-            try:
-                next_btn = driver.find_element(
-                    By.XPATH, 
-                    "//input[@class='rgPageNext'][@type='button']"
-                )
-                driver.execute_script("arguments[0].click();", next_btn)
-                time.sleep(3)
-                page_num += 1
-            except NoSuchElementException:
-                print(f"\n✅ No Next button - reached end")
-                break
+            collected += len(page_items)
+            print(f"✅ {len(page_items)} unique (Total: {collected})")
         
         except Exception as e:
             print(f"❌ Error: {e}")
             break
-    
+        
+        yield page_items
+        
+        # Stop if last page
+        if page_num == total_pages:
+            print(f"\n{'='*70}")
+            print(f"🛑 Reached last page ({page_num}/{total_pages})")
+            print(f"{'='*70}")
+            print(f"✅ Collection Complete: {collected} unique DAs")
+            print(f"{'='*70}\n")
+            break
+        
+        # Go to next page
+        try:
+            next_btn = driver.find_element(
+                By.XPATH, 
+                "//input[@class='rgPageNext'][@type='button']"
+            )
+            with metrics.stage("grid_next"):
+                previous_signature = grid_signature(driver)
+                driver.execute_script("arguments[0].click();", next_btn)
+                wait_for(driver, grid_rows_changed(previous_signature), "grid_next_page")
+            page_num += 1
+        except NoSuchElementException:
+            print("\n✅ No Next button - reached end")
+            break
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            break
+
+
+def collect_da_and_urls(driver, total_pages):
+    """
+    Collect DA numbers and normalized full URLs from all pages.
+    Returns: [{'da': str, 'url': str}, ...]
+    """
+    results = []
+    for page_items in iter_da_and_url_pages(driver, total_pages):
+        results.extend(page_items)
     return results
 
 
-# ==================== STEP 6: EXTRACT & CLEAN DATA ====================
+# ==================== STEP 5 (POSTBACK): HTTP GRID PAGINATION ====================
 
-def extract_details_from_page(driver):
+def form_fields_from_driver(driver):
     """
-    Extract all 12 fields from currently loaded detail page.
-    Uses div IDs for reliable extraction.
+    Read the live ASP.NET form (action URL and name/value pairs) from the browser.
+    Uses element .value rather than page_source attributes, because Telerik
+    keeps the typed dates and ClientState in properties set by script.
     """
-    try:
-        # Wait for content
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'makeTableRow_Content')]"))
-        )
-        time.sleep(1)
-        
-        # Click Expand All
-        try:
-            expand_buttons = driver.find_elements(By.XPATH, "//img[contains(@src, 'HeadArrowDown.png')]")
-            if expand_buttons:
-                driver.execute_script("arguments[0].click();", expand_buttons[0])
-                time.sleep(2)
-        except:
-            pass
-        
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        
-        def get_div_content(div_id):
-            """Get content from div by ID"""
-            div = soup.find("div", {"id": div_id})
-            if div:
-                return div.get_text(strip=True)
-            return ""
-        
-        # Extract DA number from page
-        da_number = ""
-        try:
-            match = re.search(r'(PCD\d+/\d+|RA\d+/\d+|RS\d+/\d+|DA\d+/\d+|MA\d+/\d+)', driver.page_source)
-            if match:
-                da_number = match.group(1)
-        except:
-            pass
-        
-        # Extract from div IDs
-        details_text = get_div_content("lblDetails")
-        decision_text = get_div_content("lblDecision")
-        categories_text = get_div_content("lblCat")
-        properties_text = get_div_content("lblProp")
-        people_text = get_div_content("lblPeople")
-        progress_text = get_div_content("lblProg")
-        fees_text = get_div_content("lblFees")
-        documents_text = get_div_content("lblDocs")
-        contact_text = get_div_content("lbl91")
-        
-        # Parse Details for Description and Submitted Date
-        description = ""
-        submitted_date = ""
-        if details_text:
-            if "Description:" in details_text:
-                parts = details_text.split("Submitted:")
-                description = parts[0].replace("Description:", "").strip()
-                if len(parts) > 1:
-                    submitted_date = parts[1].strip()
-            else:
-                description = details_text
-        
-        # Parse Properties for address
-        property_address = ""
-        if properties_text:
-            property_address = re.sub(r'<a[^>]*>(.*?)</a>', r'\1', properties_text).strip()
-        
-        # Parse People for applicant
-        applicant = ""
-        if people_text:
-            applicant = people_text.replace("Applicant:", "").strip()
-        
-        # Build record
-        record = {
-            "DA_Number": da_number,
-            "Detail_URL": driver.current_url,
-            "Description": description,
-            "Submitted_Date": submitted_date,
-            "Decision": decision_text,
-            "Categories": categories_text,
-            "Property_Address": property_address,
-            "Applicant": applicant,
-            "Progress": progress_text,
-            "Fees": fees_text,
-            "Documents": documents_text,
-            "Contact_Council": contact_text,
-        }
-        
-        # ========== STEP 6: APPLY EXACT CLEANING RULES ==========
-        
-        # Rule 1: Fees cleaning - EXACT TEXT MATCH
-        if record["Fees"].strip() == FEES_NO_FEES_TEXT:
-            record["Fees"] = "Not required"
-        
-        # Rule 2: Contact_Council cleaning - EXACT TEXT MATCH
-        if record["Contact_Council"].strip() == CONTACT_NO_EXHIBITION_TEXT:
-            record["Contact_Council"] = "Not required"
-        
-        return record
-        
-    except Exception as e:
-        return None
+    action, pairs = driver.execute_script(
+        "var form = document.forms[0];"
+        "var pairs = [];"
+        "for (var i = 0; i < form.elements.length; i++) {"
+        "  var el = form.elements[i];"
+        "  if (!el.name || el.disabled) continue;"
+        "  var type = (el.type || '').toLowerCase();"
+        "  if (['submit', 'button', 'image', 'reset', 'file'].indexOf(type) >= 0) continue;"
+        "  if ((type === 'checkbox' || type === 'radio') && !el.checked) continue;"
+        "  pairs.push([el.name, el.value]);"
+        "}"
+        "return [form.action, pairs];"
+    )
+    return action, dict(pairs)
+
+
+def post_back(session, action, fields, target, argument=""):
+    """Replay one __doPostBack(target, argument) and return (html, final_url)."""
+    data = dict(fields)
+    data["__EVENTTARGET"] = target
+    data["__EVENTARGUMENT"] = argument
+    response = session.post(action, data=data, timeout=HTTP_TIMEOUT)
+    response.raise_for_status()
+    return response.text, response.url
 
 
-def scrape_all_records(driver, da_url_list):
+def collect_da_and_urls_postback(driver):
     """
-    Scrape all records sequentially from collected DA+URL list.
-    Ensures no duplicates.
+    HTTP-level replacement for collect_da_and_urls.
+    Starts from the browser's search results, asks the grid for the largest
+    page size it accepts, then pages through with direct postbacks carrying
+    __VIEWSTATE/__EVENTVALIDATION.
+    Returns: [{'da': str, 'url': str}, ...] (empty list on failure)
     """
-    records = []
-    seen_das = set()
-    
     print("\n" + "="*70)
-    print("STEP 6: Scraping All Records Sequentially")
+    print("STEP 5: Collecting DA Numbers + Full URLs (postback)")
     print("="*70)
-    print(f"Total records to scrape: {len(da_url_list)}\n")
     
-    for i, item in enumerate(da_url_list, 1):
-        da = item["da"]
-        url = item["url"]
-        
-        print(f"[{i:3d}/{len(da_url_list)}] DA: {da:<15}", end=" ")
+    session = create_http_session(driver)
+    action, fields = form_fields_from_driver(driver)
+    page = parse_results_page(driver.page_source, driver.current_url)
+    total_pages = page["total_pages"]
+    
+    try:
+        # Ask for the biggest page the grid will accept
+        if page["grid_id"] and total_pages and total_pages > 1:
+            for size in GRID_PAGE_SIZES:
+                try:
+                    resized_html, final_url = post_back(
+                        session, action, fields, page["grid_id"],
+                        f"FireCommand:{page['master_id']};PageSize;{size}",
+                    )
+                except requests.RequestException as e:
+                    print(f"⚠️  Page size {size} rejected ({type(e).__name__})")
+                    continue
+                
+                resized = parse_results_page(resized_html, final_url)
+                if resized["total_pages"] and resized["total_pages"] < total_pages:
+                    print(f"✅ Grid page size {size}: {total_pages} → {resized['total_pages']} pages")
+                    page, total_pages = resized, resized["total_pages"]
+                    action, fields = page["form_action"], page["form_fields"]
+                    break
         
-        # Skip if already scraped (duplicate prevention)
-        if da in seen_das:
-            print("⚠️  (duplicate, skipped)")
-            continue
+        total_pages = total_pages or 1
+        results = []
+        seen_das = set()
+        page_num = 1
         
-        try:
-            # Navigate to detail page
-            driver.get(url)
-            
-            # Extract data
-            record = extract_details_from_page(driver)
+        while True:
+            if page["rows"] is None:
+                print("⚠️  Table not found")
+                break
             
-            if record:
-                # Fill in DA if missing
-                if not record.get("DA_Number"):
-                    record["DA_Number"] = da
-                
-                # Fill in URL if missing
-                if not record.get("Detail_URL"):
-                    record["Detail_URL"] = url
-                
-                records.append(record)
+            metrics.inc("grid_pages")
+            page_count = 0
+            for da, href in page["rows"]:
+                if da in seen_das:
+                    continue
+                results.append({"da": da, "url": normalize_url(href)})
                 seen_das.add(da)
-                print("✅")
-            else:
-                print("⚠️  (no data)")
+                page_count += 1
+            
+            print(f"📄 Page {page_num}/{total_pages}: ✅ {page_count} unique (Total: {len(results)})")
+            
+            if page_num >= total_pages:
+                break
+            
+            if not page["next_target"]:
+                print("✅ No Next button - reached end")
+                break
+            
+            with metrics.stage("grid_next"):
+                html, final_url = post_back(session, action, fields, page["next_target"])
+            with metrics.stage("grid_parse"):
+                page = parse_results_page(html, final_url)
+            action, fields = page["form_action"], page["form_fields"]
+            page_num += 1
         
-        except Exception as e:
-            print(f"❌ ({type(e).__name__})")
-            continue
+        print(f"✅ Collection Complete: {len(results)} unique DAs\n")
+        return results
     
-    print(f"\n{'='*70}")
-    print(f"✅ Scraping Complete")
-    print(f"   Total records extracted: {len(records)}")
-    print(f"   Duplicates prevented: {len(da_url_list) - len(records)}")
-    print(f"{'='*70}\n")
+    except Exception as e:
+        print(f"❌ Postback collection failed: {e}")
+        return []
+    finally:
+        session.close()
+
+
+# ==================== STEP 6: EXTRACT & CLEAN DATA ====================
+
+def output_headers():
+    """The CSV columns for this run: FIELDS (validated) or all HEADERS."""
+    if not FIELDS:
+        return list(HEADERS)
+    unknown = [field for field in FIELDS if field not in HEADERS]
+    if unknown:
+        raise ValueError(f"Unknown FIELDS: {', '.join(unknown)}")
+    return list(FIELDS)
+
+
+def required_sections():
+    """
+    Detail section IDs the output columns need, in page order. Incremental
+    runs also need lblDecision (finality) and document downloads lblDocs.
+    """
+    needed = {FIELD_SECTIONS[field] for field in output_headers() if field in FIELD_SECTIONS}
+    if INCREMENTAL:
+        needed.add("lblDecision")
+    if DOCUMENTS_DIR:
+        needed.add(DOCUMENTS_SECTION_ID)
+    return [section_id for section_id in DETAIL_SECTION_IDS if section_id in needed]
+
+
+def parse_detail_html(html, current_url):
+    """
+    Extract the output columns (output_headers(): FIELDS, or every column)
+    from detail page HTML. Shared by the Selenium and HTTP engines so both
+    clean identically. The page is parsed once (lxml) and only the sections
+    in required_sections() are read; fields from other sections stay empty.
+    Returns a CompactRecord; writers expand it at output time.
+    """
+    with metrics.stage("record_parse"):
+        record = _build_record(html, current_url)
     
-    return records
+    with metrics.stage("record_clean"):
+        return CompactRecord(clean_record(record))
 
 
-# ==================== STEP 7: SAVE TO CSV ====================
+def _build_record(html, current_url):
+    """
+    Uncleaned 12-field record from detail page HTML, plus Document_Links
+    (absolute lblDocs links; not a CSV column). Only required_sections()
+    are parsed; the other fields are left empty.
+    """
+    page = parse_detail_page(html, required_sections(), base_url=current_url)
+    sections, da_number = page["sections"], page["da_number"]
+    
+    # Extract from div IDs
+    details_text = sections.get("lblDetails", "")
+    decision_text = sections.get("lblDecision", "")
+    categories_text = sections.get("lblCat", "")
+    properties_text = sections.get("lblProp", "")
+    people_text = sections.get("lblPeople", "")
+    progress_text = sections.get("lblProg", "")
+    fees_text = sections.get("lblFees", "")
+    documents_text = sections.get("lblDocs", "")
+    contact_text = sections.get("lbl91", "")
+    
+    # Parse Details for Description and Submitted Date
+    description = ""
+    submitted_date = ""
+    if details_text:
+        if "Description:" in details_text:
+            parts = details_text.split("Submitted:")
+            description = parts[0].replace("Description:", "").strip()
+            if len(parts) > 1:
+                submitted_date = parts[1].strip()
+        else:
+            description = details_text
+    
+    # Parse Properties for address
+    property_address = ""
+    if properties_text:
+        property_address = ANCHOR_TAG_RE.sub(r'\1', properties_text).strip()
+    
+    # Parse People for applicant
+    applicant = ""
+    if people_text:
+        applicant = people_text.replace("Applicant:", "").strip()
+    
+    # Build record
+    record = {
+        "DA_Number": da_number,
+        "Detail_URL": current_url,
+        "Description": description,
+        "Submitted_Date": submitted_date,
+        "Decision": decision_text,
+        "Categories": categories_text,
+        "Property_Address": property_address,
+        "Applicant": applicant,
+        "Progress": progress_text,
+        "Fees": fees_text,
+        "Documents": documents_text,
+        "Contact_Council": contact_text,
+        "Document_Links": page["documents"],
+    }
+    
+    return record
 
-def save_records_to_csv(records, filename):
-    """STEP 7: Save all records to CSV with exact 12 headers."""
-    print("\n" + "="*70)
-    print("STEP 7: Save to CSV")
-    print("="*70)
+
+def clean_record(record):
+    """STEP 6: Apply exact cleaning rules in place and return the record."""
+    # Rule 1: Fees cleaning - EXACT TEXT MATCH
+    if record["Fees"].strip() == FEES_NO_FEES_TEXT:
+        record["Fees"] = "Not required"
     
-    try:
-        df = pd.DataFrame(records)
-        
-        # Ensure all headers exist
-        for header in HEADERS:
-            if header not in df.columns:
-                df[header] = ""
-        
-        # Reorder columns to match exact header order
-        df = df[HEADERS]
-        
-        # Save to CSV
-        df.to_csv(filename, index=False, encoding="utf-8-sig")
-        
-        print(f"\n✅ CSV SAVED SUCCESSFULLY")
-        print(f"   File: {filename}")
-        print(f"   Total Records: {len(df)}")
-        print(f"   Columns: {len(HEADERS)}")
-        print(f"\n   Column Headers:")
-        for i, header in enumerate(HEADERS, 1):
-            print(f"     {i:2d}. {header}")
-        
-        if len(df) > 0:
-            print(f"\n   Data Quality:")
-            print(f"     Non-empty DA_Numbers: {(df['DA_Number'] != '').sum()}/{len(df)}")
-            print(f"     Records with Description: {(df['Description'] != '').sum()}/{len(df)}")
-            print(f"     Records with Decision: {(df['Decision'] != '').sum()}/{len(df)}")
-            print(f"     Fees (cleaned): {(df['Fees'] != '').sum()}/{len(df)}")
-            print(f"     Contact_Council (cleaned): {(df['Contact_Council'] != '').sum()}/{len(df)}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    # Rule 2: Contact_Council cleaning - EXACT TEXT MATCH
+    if record["Contact_Council"].strip() == CONTACT_NO_EXHIBITION_TEXT:
+        record["Contact_Council"] = "Not required"
+    
+    return record
 
 
-# ==================== MAIN EXECUTION ====================
+def fill_record_defaults(record, da, url):
+    """Fill DA_Number / Detail_URL from the collected list when the page lacks them."""
+    # Fill in DA if missing
+    if not record.get("DA_Number"):
+        record["DA_Number"] = da
+    
+    # Fill in URL if missing
+    if not record.get("Detail_URL"):
+        record["Detail_URL"] = url
+    
+    return record
 
-def main():
-    """Main execution - All 7 Steps."""
-    driver = create_driver(headless=False)
+
+def extract_details_from_page(driver, cache=None, url=None):
+    """
+    Extract the output fields from currently loaded detail page.
+    Uses div IDs for reliable extraction. "Expand All" is only clicked when
+    a required section is collapsed by default.
+    With a PageCache the page source is stored under `url` (default: current URL).
+    A page whose content never appears raises TimeoutException, so the caller
+    can retry it; None means the page loaded but could not be parsed.
+    """
+    with metrics.stage("record_expand"):
+        # Wait for content
+        wait_for(driver, details_present, "detail_content", timeout=10)
+        
+        # Click Expand All (best effort: collapsed sections just stay empty)
+        sections = required_sections()
+        try:
+            expand_buttons = []
+            if not set(sections) <= ALWAYS_VISIBLE_SECTIONS:
+                expand_buttons = driver.find_elements(By.XPATH, "//img[contains(@src, 'HeadArrowDown.png')]")
+            if expand_buttons:
+                driver.execute_script("arguments[0].click();", expand_buttons[0])
+                wait_for(driver, lambda d: sections_expanded(d, sections), "detail_expand",
+                         timeout=5, required=False)
+        except (StaleElementReferenceException, JavascriptException):
+            pass
     
+    html = driver.page_source
+    if cache is not None:
+        cache.put(url or driver.current_url, html, driver.current_url)
     try:
-        print("\n" + "="*70)
-        print("🚀 SHOALHAVEN DA TRACKING SCRAPER - FINAL COMPLETE")
-        print("="*70)
-        print(f"📅 Date Range: {START_DATE} to {END_DATE}")
-        print(f"📂 Output File: {OUTPUT_CSV}")
-        print(f"✨ Features:")
-        print(f"   • URL normalization (relative → absolute)")
-        print(f"   • Sequential scraping (no duplicates)")
-        print(f"   • Exact cleaning rules applied")
-        print(f"   • 12-column CSV output")
-        print("="*70 + "\n")
-        
-        # STEPS 1-4: Setup and Search
-        if not step_1_accept_disclaimer(driver):
-            return
-        if not step_2_navigate_da_tracking(driver):
-            return
-        if not step_3_open_advanced_search(driver):
-            return
-        if not step_4_set_date_range(driver, START_DATE, END_DATE):
-            return
-        if not step_4b_click_search(driver):
+        return parse_detail_html(html, driver.current_url)
+    except Exception:
+        return None
+
+
+def open_page_cache():
+    """PageCache configured from PAGE_CACHE_*, or None when caching is off."""
+    if not PAGE_CACHE_DIR:
+        return None
+    return PageCache(PAGE_CACHE_DIR, PAGE_CACHE_TTL, PAGE_CACHE_MAX_BYTES, normalize=normalize_url)
+
+
+def cached_details(cache, url):
+    """(hit, record) for a cached detail page; record may be None on parse failure."""
+    cached = cache.get(url) if cache is not None else None
+    if cached is None:
+        return False, None
+    metrics.inc("cache_hits")
+    html, final_url = cached
+    try:
+        return True, parse_detail_html(html, final_url)
+    except Exception:
+        return True, None
+
+
+def replay_records_from_cache(cache):
+    """Re-run extraction and cleaning over every cached page, oldest first."""
+    for url, html, final_url in cache.entries():
+        try:
+            record = parse_detail_html(html, final_url)
+        except Exception:
+            continue
+        if record:
+            yield fill_record_defaults(record, "", url)
+
+
+# ==================== FETCH CONTROL ====================
+
+def create_fetch_controller(concurrency=1, rate=None):
+    """FetchController for one host, configured from the fetch-control settings."""
+    return FetchController(
+        rate or MAX_REQUESTS_PER_SECOND,
+        concurrency,
+        max_attempts=FETCH_MAX_ATTEMPTS,
+        backoff_base=BACKOFF_BASE,
+        backoff_cap=BACKOFF_CAP,
+        min_rate=MIN_REQUESTS_PER_SECOND,
+        latency_target=LATENCY_TARGET,
+        breaker_threshold=BREAKER_THRESHOLD,
+        breaker_cooldown=BREAKER_COOLDOWN,
+    )
+
+
+def report_fetch_control(controller):
+    """One-line fetch-control summary at the end of an engine run."""
+    print(f"\n🚦 Fetch control: {controller.summary()}")
+    metrics.inc("fetch_retries", controller.retries)
+    metrics.inc("breaker_trips", controller.breaker.trips)
+
+
+# ==================== STEP 6 (HTTP ENGINE): BROWSERLESS DETAIL FETCH ====================
+
+def create_http_session(driver):
+    """
+    Build a pooled keep-alive HTTP session that carries the browser's cookies.
+    Call after step_1_accept_disclaimer so the disclaimer cookie is present.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    
+    try:
+        session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent;")
+    except Exception:
+        pass
+    
+    for cookie in driver.get_cookies():
+        session.cookies.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain"),
+            path=cookie.get("path", "/"),
+        )
+    
+    return session
+
+
+def fetch_detail_html(session, url, cache=None, controller=None):
+    """
+    GET a detail page and return (html, final_url), serving fresh pages from
+    the cache when one is given. With a FetchController the GET is paced and
+    retried by it.
+    The lbl* sections are server-rendered; "Expand All" only toggles their
+    visibility in the browser, so the raw HTML already holds every field.
+    """
+    if cache is not None:
+        cached = cache.get(url)
+        if cached is not None:
+            metrics.inc("cache_hits")
+            return cached
+    
+    def get():
+        with metrics.stage("record_fetch"):
+            response = session.get(url, timeout=HTTP_TIMEOUT)
+        metrics.inc("http_requests")
+        response.raise_for_status()
+        return response
+    
+    response = controller.call(get) if controller is not None else get()
+    if cache is not None:
+        cache.put(url, response.text, response.url)
+    return response.text, response.url
+
+
+def extract_details_via_http(session, url, cache=None, controller=None):
+    """
+    HTTP-engine counterpart of extract_details_from_page.
+    Network errors propagate (after the controller's retries); parse
+    failures return None.
+    """
+    html, final_url = fetch_detail_html(session, url, cache, controller)
+    try:
+        return parse_detail_html(html, final_url)
+    except Exception:
+        return None
+
+
+def open_document_downloader(driver):
+    """DocumentDownloader for DOCUMENTS_DIR using the browser's session, or None."""
+    if not DOCUMENTS_DIR:
+        return None
+    session = create_http_session(driver)
+    adapter = HTTPAdapter(pool_connections=DOCUMENT_WORKERS, pool_maxsize=DOCUMENT_WORKERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return DocumentDownloader(session, DocumentStore(DOCUMENTS_DIR), DOCUMENT_WORKERS, HTTP_TIMEOUT)
+
+
+# ==================== STEP 6 (ASYNC ENGINE): CONCURRENT DETAIL FETCH ====================
+
+async def _fetch_details_async(cookies, user_agent, items, concurrency, rate, deliver, controller=None):
+    """
+    Fetch and parse detail pages with at most `concurrency` requests in flight
+    and at most `rate` requests/second per host. A FetchController per host
+    (or the given `controller` for every host) retries transient failures and
+    lowers rate/concurrency when it struggles.
+    deliver(index, result) is called as each page finishes; result is a
+    record dict, None (no data) or the exception raised.
+    """
+    import aiohttp
+
+    semaphore = asyncio.Semaphore(concurrency)
+    controllers = {}
+    cache = open_page_cache()
+
+    async def fetch_one(session, index, item):
+        hit, record = cached_details(cache, item["url"])
+        if hit:
+            deliver(index, record)
             return
         
-        # Check for results
-        if "No records" in driver.page_source:
-            print("❌ No records found")
-            return
+        host = urlsplit(item["url"]).hostname
+        host_controller = controller or controllers.get(host)
+        if host_controller is None:
+            host_controller = controllers[host] = create_fetch_controller(concurrency, rate)
         
-        # Extract total pages
-        total_items, total_pages = extract_total_pages_and_items(driver)
+        async def get():
+            with metrics.stage("record_fetch"):
+                async with session.get(item["url"]) as response:
+                    response.raise_for_status()
+                    html = await response.text()
+                    final_url = str(response.url)
+            metrics.inc("http_requests")
+            return html, final_url
         
-        if total_pages is None:
-            print("❌ Could not extract total pages")
-            return
+        try:
+            async with semaphore:
+                html, final_url = await host_controller.acall(get)
+            if cache is not None:
+                cache.put(item["url"], html, final_url)
+            try:
+                result = parse_detail_html(html, final_url)
+            except Exception:
+                result = None
+        except Exception as e:
+            result = e
+        deliver(index, result)
+
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=concurrency)
+    timeout = aiohttp.ClientTimeout(total=HTTP_TIMEOUT)
+    headers = {"User-Agent": user_agent} if user_agent else None
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=timeout, cookies=cookies, headers=headers
+    ) as session:
+        await asyncio.gather(*(fetch_one(session, i, item) for i, item in enumerate(items)))
+    
+    for host_controller in controllers.values():
+        report_fetch_control(host_controller)
+
+
+def iter_details_async(driver, items, concurrency=None, rate=None, controller=None):
+    """
+    Async engine: run the aiohttp pipeline on a background event loop and
+    yield (item, record, error) in item order as results become contiguous.
+    """
+    concurrency = concurrency or DETAIL_CONCURRENCY
+    rate = rate or MAX_REQUESTS_PER_SECOND
+    print(f"Concurrency: {concurrency} | Rate limit: {rate}/s per host\n")
+    
+    cookies = {c["name"]: c["value"] for c in driver.get_cookies()}
+    try:
+        user_agent = driver.execute_script("return navigator.userAgent;")
+    except Exception:
+        user_agent = None
+    
+    results = queue.Queue()
+    
+    def run_loop():
+        try:
+            asyncio.run(_fetch_details_async(
+                cookies, user_agent, items, concurrency, rate,
+                lambda index, result: results.put((index, result)), controller,
+            ))
+        except Exception as e:
+            results.put((None, e))
+        finally:
+            results.put(None)
+    
+    threading.Thread(target=run_loop, daemon=True).start()
+    
+    pending = {}
+    next_index = 0
+    while True:
+        message = results.get()
+        if message is None:
+            break
+        index, result = message
+        if index is None:
+            raise result
+        pending[index] = result
         
-        print(f"\n📊 Search Results Detected:")
-        print(f"   Total Items: {total_items}")
-        print(f"   Total Pages: {total_pages}\n")
+        while next_index in pending:
+            result = pending.pop(next_index)
+            item = items[next_index]
+            next_index += 1
+            if isinstance(result, Exception):
+                yield item, None, type(result).__name__
+            else:
+                yield item, result, None
+
+
+# ==================== STEP 6 (POOL ENGINE): MULTI-PROCESS WEBDRIVER WORKERS ====================
+
+def _pool_worker(worker_id, headless, task_queue, result_queue):
+    """
+    Worker process: owns one Chrome session for its whole life.
+    Takes (shard_index, shard) tasks until it receives None.
+    """
+    driver = None
+    cache = open_page_cache()
+    # The per-host rate budget is split between the workers
+    controller = create_fetch_controller(rate=MAX_REQUESTS_PER_SECOND / POOL_WORKERS)
+    try:
+        driver = create_driver(headless=headless, profile=f"pool-{worker_id}")
+        step_1_accept_disclaimer(driver)
         
-        # STEP 5: Collect DA + URLs
-        da_url_list = collect_da_and_urls(driver, total_pages)
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+            shard_index, shard = task
+            
+            results = []
+            for item in shard:
+                hit, record = cached_details(cache, item["url"])
+                if hit:
+                    results.append((item, record, None))
+                    continue
+                try:
+                    results.append((item, open_detail_page(driver, item["url"], controller, cache), None))
+                except Exception as e:
+                    results.append((item, None, type(e).__name__))
+            result_queue.put(("shard", shard_index, results))
+    
+    except Exception as e:
+        result_queue.put(("error", worker_id, f"{type(e).__name__}: {e}"))
+    finally:
+        if driver is not None:
+            driver.quit()
+
+
+def iter_details_pool(items, workers=None, shard_size=None, headless=None):
+    """
+    Pool engine: a pool of worker processes, each driving its own Chrome from
+    create_driver(). Shards of items are handed out on demand and results are
+    yielded as (item, record, error) in item order.
+    """
+    workers = workers or POOL_WORKERS
+    shard_size = shard_size or POOL_SHARD_SIZE
+    headless = POOL_HEADLESS if headless is None else headless
+    
+    if not items:
+        return
+    
+    shards = [items[i:i + shard_size] for i in range(0, len(items), shard_size)]
+    workers = min(workers, len(shards))
+    print(f"Workers: {workers} | Shard size: {shard_size}\n")
+    
+    ctx = mp.get_context("spawn")
+    task_queue = ctx.Queue()
+    result_queue = ctx.Queue()
+    processes = [
+        ctx.Process(target=_pool_worker, args=(n, headless, task_queue, result_queue), daemon=True)
+        for n in range(workers)
+    ]
+    for proc in processes:
+        proc.start()
+    for shard_index, shard in enumerate(shards):
+        task_queue.put((shard_index, shard))
+    for _ in processes:
+        task_queue.put(None)
+    
+    pending = {}
+    next_shard = 0
+    failed_workers = 0
+    
+    try:
+        while next_shard < len(shards):
+            try:
+                message = result_queue.get(timeout=WAIT_TIME)
+            except queue.Empty:
+                if not any(proc.is_alive() for proc in processes):
+                    print("❌ All pool workers exited before finishing")
+                    break
+                continue
+            
+            if message[0] == "error":
+                failed_workers += 1
+                print(f"❌ Pool worker {message[1]} failed: {message[2]}")
+                if failed_workers == workers:
+                    break
+                continue
+            
+            _, shard_index, results = message
+            pending[shard_index] = results
+            
+            # Emit every shard that is now contiguous with what's been yielded
+            while next_shard in pending:
+                yield from pending.pop(next_shard)
+                next_shard += 1
         
-        if not da_url_list:
-            print("❌ No DA+URL pairs collected")
+        # A worker that died mid-shard leaves a gap; keep what the others finished
+        for shard_index in sorted(pending):
+            yield from pending[shard_index]
+        missing = len(shards) - next_shard - len(pending)
+        if missing > 0:
+            print(f"⚠️  {missing} shard(s) lost to failed workers")
+    finally:
+        for proc in processes:
+            proc.join(timeout=WAIT_TIME)
+            if proc.is_alive():
+                proc.terminate()
+
+
+# ==================== STEP 6 (TABS ENGINE): MULTIPLEXED TABS IN ONE CHROME ====================
+
+def start_tab_navigation(driver, url):
+    """
+    Point the current tab at url without waiting for it to load. The marker
+    disappears with the old document, so tab_ready() cannot see a stale page.
+    """
+    driver.execute_script("window.__daTabPending = true; window.location.href = arguments[0];", url)
+
+
+def tab_ready(driver):
+    """Condition: the current tab left its previous page and the new DOM is parsed."""
+    return driver.execute_script(
+        "return !window.__daTabPending && document.readyState !== 'loading';"
+    )
+
+
+def open_tabs(driver, count):
+    """The driver's current tab plus count-1 new ones (resource blocking applied)."""
+    handles = [driver.current_window_handle]
+    for _ in range(count - 1):
+        driver.switch_to.new_window("tab")
+        if BLOCK_RESOURCES:
+            block_resources(driver)
+        handles.append(driver.current_window_handle)
+    return handles
+
+
+def iter_details_tabs(driver, items, tabs=None, controller=None):
+    """
+    Tabs engine: TAB_COUNT tabs of the one Chrome share its cookies and
+    disclaimer state. Each idle tab starts the next navigation without
+    waiting; loaded tabs are polled round-robin, extracted, and handed the
+    next URL. Results are yielded as (item, record, error) in item order.
+    """
+    if not items:
+        return
+    tabs = min(tabs or TAB_COUNT, len(items))
+    print(f"Tabs: {tabs}\n")
+
+    cache = open_page_cache()
+    shared = controller is not None
+    controller = controller or create_fetch_controller(concurrency=tabs)
+    main_handle = driver.current_window_handle
+
+    pending = deque((index, item, 1) for index, item in enumerate(items))
+    idle = {}      # handle -> monotonic time it may navigate again
+    busy = {}      # handle -> (index, item, attempt, started)
+    results = {}
+    next_index = 0
+
+    try:
+        handles = open_tabs(driver, tabs)
+        idle = dict.fromkeys(handles, 0.0)
+
+        while next_index < len(items):
+            progressed = False
+
+            # Hand the next URLs to idle tabs
+            for handle, resume_at in list(idle.items()):
+                while pending and pending[0][2] == 1:
+                    index, item, _ = pending[0]
+                    hit, record = cached_details(cache, item["url"])
+                    if not hit:
+                        break
+                    pending.popleft()
+                    results[index] = (item, record, None)
+                    progressed = True
+                if not pending:
+                    break
+                if time.monotonic() < resume_at or controller.try_acquire():
+                    continue
+
+                index, item, attempt = pending.popleft()
+                driver.switch_to.window(handle)
+                start_tab_navigation(driver, item["url"])
+                del idle[handle]
+                busy[handle] = (index, item, attempt, time.perf_counter())
+                progressed = True
+
+            # Collect every tab that has finished loading
+            for handle, (index, item, attempt, started) in list(busy.items()):
+                driver.switch_to.window(handle)
+                elapsed = time.perf_counter() - started
+                try:
+                    ready = tab_ready(driver)
+                except Exception:
+                    ready = False
+                if not ready and elapsed < TAB_LOAD_TIMEOUT:
+                    continue
+
+                del busy[handle]
+                idle[handle] = 0.0
+                progressed = True
+                if ready:
+                    try:
+                        record = extract_details_from_page(driver, cache, item["url"])
+                    except Exception as e:
+                        error = e
+                    else:
+                        controller.complete(elapsed)
+                        metrics.observe("record_fetch", elapsed)
+                        results[index] = (item, record, None)
+                        continue
+                else:
+                    error = TimeoutException(f"Tab load exceeded {TAB_LOAD_TIMEOUT}s")
+                if controller.fail(error, attempt):
+                    pending.appendleft((index, item, attempt + 1))
+                    idle[handle] = time.monotonic() + backoff_delay(
+                        attempt, controller.backoff_base, controller.backoff_cap
+                    )
+                else:
+                    results[index] = (item, None, type(error).__name__)
+
+            while next_index in results:
+                yield results.pop(next_index)
+                next_index += 1
+
+            if not progressed:
+                time.sleep(0.05)
+    finally:
+        for handle in driver.window_handles:
+            if handle == main_handle:
+                continue
+            try:
+                driver.switch_to.window(handle)
+                driver.close()
+            except Exception:
+                pass
+        driver.switch_to.window(main_handle)
+        if not shared:
+            report_fetch_control(controller)
+
+
+# ==================== STEP 6: SCRAPE ALL RECORDS ====================
+
+def open_detail_page(driver, url, controller=None, cache=None):
+    """
+    Navigate the driver to a detail page and extract its record, paced and
+    retried by `controller`: a page that times out is retried like a failed request.
+    """
+    def fetch():
+        with metrics.stage("record_fetch"):
+            driver.get(url)
+        return extract_details_from_page(driver, cache, url)
+    
+    if controller is None:
+        return fetch()
+    return controller.call(fetch)
+
+
+def iter_details_selenium(driver, items, controller=None):
+    """Selenium engine: navigate the shared driver to each detail page."""
+    cache = open_page_cache()
+    shared = controller is not None
+    controller = controller or create_fetch_controller()
+    try:
+        for item in items:
+            hit, record = cached_details(cache, item["url"])
+            if hit:
+                yield item, record, None
+                continue
+            try:
+                # Navigate to detail page and extract data
+                yield item, open_detail_page(driver, item["url"], controller, cache), None
+            except Exception as e:
+                yield item, None, type(e).__name__
+    finally:
+        if not shared:
+            report_fetch_control(controller)
+
+
+def iter_details_http(driver, items, controller=None):
+    """HTTP engine: one pooled keep-alive session carrying the browser's cookies."""
+    session = create_http_session(driver)
+    cache = open_page_cache()
+    shared = controller is not None
+    controller = controller or create_fetch_controller()
+    try:
+        for item in items:
+            try:
+                yield item, extract_details_via_http(session, item["url"], cache, controller), None
+            except Exception as e:
+                yield item, None, type(e).__name__
+    finally:
+        session.close()
+        if not shared:
+            report_fetch_control(controller)
+
+
+def iter_detail_results(driver, items, engine=None, controller=None):
+    """
+    Yield (item, record, error) for every item, in item order, using the
+    chosen engine. record is None when the page had no data or failed;
+    error is the exception class name on failure. A `controller` shared
+    between runs replaces the engine's own (and is not reported by it);
+    the pool engine's worker processes always pace themselves.
+    """
+    engine = engine or DETAIL_ENGINE
+    if engine == "http":
+        return iter_details_http(driver, items, controller)
+    if engine == "async":
+        return iter_details_async(driver, items, controller=controller)
+    if engine == "pool":
+        return iter_details_pool(items)
+    if engine == "tabs":
+        return iter_details_tabs(driver, items, controller=controller)
+    return iter_details_selenium(driver, items, controller)
+
+
+def dedupe_da_url_list(da_url_list):
+    """Drop repeated DAs, keeping the first occurrence and list order."""
+    seen_das = set()
+    unique_items = []
+    for item in da_url_list:
+        if item["da"] in seen_das:
+            continue
+        seen_das.add(item["da"])
+        unique_items.append(item)
+    return unique_items
+
+
+def scrape_all_records(driver, da_url_list, engine=None, on_record=None, on_failure=None,
+                       keep_records=True):
+    """
+    Scrape all records from collected DA+URL list, in list order.
+    Ensures no duplicates.
+    engine: "selenium" (default), "http", "async", "pool" or "tabs" - see DETAIL_ENGINE.
+    on_record(item, record) / on_failure(item, error) are called as each
+    result arrives, so callers can persist progress. With keep_records=False
+    records are only handed to on_record and the returned list stays empty.
+    """
+    engine = engine or DETAIL_ENGINE
+    unique_items = dedupe_da_url_list(da_url_list)
+    
+    print("\n" + "="*70)
+    print("STEP 6: Scraping All Records")
+    print("="*70)
+    print(f"Detail engine: {engine}")
+    print(f"Total records to scrape: {len(unique_items)}\n")
+    
+    results = iter_detail_results(driver, unique_items, engine)
+    records, extracted = consume_detail_results(
+        results, len(unique_items), on_record, on_failure, keep_records
+    )
+    
+    print(f"\n{'='*70}")
+    print("✅ Scraping Complete")
+    print(f"   Total records extracted: {extracted}")
+    print(f"   Duplicates prevented: {len(da_url_list) - len(unique_items)}")
+    print(f"{'='*70}\n")
+    
+    return records
+
+
+def consume_detail_results(results, total, on_record=None, on_failure=None, keep_records=True):
+    """
+    Print one line per (item, record, error) result and dispatch it to
+    on_record / on_failure. Returns (records, extracted_count).
+    """
+    records = []
+    extracted = 0
+    for i, (item, record, error) in enumerate(results, 1):
+        da = item["da"]
+        print(f"[{i:3d}/{total}] DA: {da:<15}", end=" ")
+        
+        if error:
+            print(f"❌ ({error})")
+            metrics.inc("records_failed")
+            if on_failure:
+                on_failure(item, error)
+        elif record:
+            record = fill_record_defaults(record, da, item["url"])
+            extracted += 1
+            metrics.inc("records_ok")
+            if keep_records:
+                records.append(record)
+            if on_record:
+                on_record(item, record)
+            print("✅")
+        else:
+            print("⚠️  (no data)")
+            metrics.inc("records_empty")
+            if on_failure:
+                on_failure(item, "no data")
+    
+    return records, extracted
+
+
+# ==================== STEPS 5+6 (PIPELINE): OVERLAPPED COLLECTION & SCRAPING ====================
+
+def iter_details_pipelined(driver, pages, workers=None, queue_size=None):
+    """
+    Consume `pages` (an iterator of per-page item lists, usually
+    iter_da_and_url_pages driving `driver`) in this thread while
+    `workers` HTTP threads fetch the detail pages already queued.
+    The task queue holds at most `queue_size` items, so pagination blocks
+    when the fetchers fall behind. Yields (item, record, error) in item order.
+    """
+    workers = workers or DETAIL_CONCURRENCY
+    queue_size = queue_size or PIPELINE_QUEUE_SIZE
+    print(f"Pipeline: {workers} fetch workers | queue size {queue_size}\n")
+    
+    session = create_http_session(driver)
+    cache = open_page_cache()
+    controller = create_fetch_controller(workers)
+    tasks = queue.Queue(maxsize=queue_size)
+    results = queue.Queue()
+    
+    def worker():
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            index, item = task
+            try:
+                record = extract_details_via_http(session, item["url"], cache, controller)
+                results.put((index, item, record, None))
+            except Exception as e:
+                results.put((index, item, None, type(e).__name__))
+    
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    
+    pending = {}
+    next_index = 0
+    submitted = 0
+    
+    def collect_finished(wait):
+        # Wait briefly for one result if asked, then take whatever is ready
+        try:
+            message = results.get(timeout=0.1) if wait else results.get_nowait()
+            while True:
+                pending[message[0]] = message[1:]
+                message = results.get_nowait()
+        except queue.Empty:
+            pass
+    
+    def contiguous():
+        nonlocal next_index
+        while next_index in pending:
+            item, record, error = pending.pop(next_index)
+            next_index += 1
+            yield item, record, error
+    
+    try:
+        for page_items in pages:
+            for item in page_items:
+                while True:
+                    try:
+                        tasks.put((submitted, item), timeout=0.1)
+                        break
+                    except queue.Full:
+                        # Backpressure: hand finished records on while waiting
+                        collect_finished(wait=False)
+                        yield from contiguous()
+                submitted += 1
+            collect_finished(wait=False)
+            yield from contiguous()
+        
+        while next_index < submitted:
+            collect_finished(wait=True)
+            yield from contiguous()
+    finally:
+        # Drop unstarted work if the consumer stopped early, then stop workers
+        try:
+            while True:
+                tasks.get_nowait()
+        except queue.Empty:
+            pass
+        for _ in threads:
+            tasks.put(None)
+        for thread in threads:
+            thread.join(timeout=HTTP_TIMEOUT)
+        session.close()
+        report_fetch_control(controller)
+
+
+def scrape_pipelined(driver, total_items, total_pages, on_record=None, on_failure=None,
+                     on_page=None, skip_das=None):
+    """
+    STEPS 5+6 overlapped: each grid page's DAs are queued for the HTTP
+    fetch workers as soon as the page is parsed, while the browser moves on
+    to the next page. Call after step_4b with the results grid showing.
+    on_page(page_items) sees every collected page (e.g. to checkpoint it);
+    DAs in skip_das are collected but not scraped.
+    Returns the number of DAs collected.
+    """
+    collected = 0
+    
+    def pages():
+        nonlocal collected
+        for page_items in iter_da_and_url_pages(driver, total_pages):
+            collected += len(page_items)
+            if on_page:
+                on_page(page_items)
+            if skip_das:
+                page_items = [item for item in page_items if item["da"] not in skip_das]
+            yield page_items
+    
+    print("\n" + "="*70)
+    print("STEPS 5+6: Pipelined Collection & Scraping")
+    print("="*70)
+    
+    results = iter_details_pipelined(driver, pages())
+    _, extracted = consume_detail_results(
+        results, f"~{total_items}", on_record, on_failure, keep_records=False
+    )
+    
+    print(f"\n{'='*70}")
+    print("✅ Scraping Complete")
+    print(f"   DAs collected: {collected}")
+    print(f"   Total records extracted: {extracted}")
+    print(f"{'='*70}\n")
+    
+    return collected
+
+
+# ==================== SUMMARY MODE: GRID-ONLY RECORDS ====================
+
+def grid_summary(item):
+    """Summary record for a collected item: DA_Number, Detail_URL + grid columns."""
+    summary = {"DA_Number": item["da"], "Detail_URL": item["url"]}
+    summary.update(item.get("grid") or {})
+    return summary
+
+
+def iter_grid_summaries(driver, total_pages):
+    """Yield a summary record for every results-grid row, page by page."""
+    for page_items in iter_da_and_url_pages(driver, total_pages, with_columns=True):
+        for item in page_items:
+            yield grid_summary(item)
+
+
+def enrich_summaries(driver, summaries, predicate=None, engine=None, on_record=None,
+                     on_failure=None):
+    """
+    Fetch and parse detail pages only for the summaries `predicate` selects
+    (all of them when None). Returns the full 12-field records; with
+    on_record set they are streamed instead (see scrape_all_records).
+    """
+    items = [
+        {"da": summary["DA_Number"], "url": summary["Detail_URL"]}
+        for summary in summaries
+        if predicate is None or predicate(summary)
+    ]
+    if not items:
+        return []
+    return scrape_all_records(
+        driver, items, engine,
+        on_record=on_record, on_failure=on_failure, keep_records=on_record is None,
+    )
+
+
+def summary_main(driver):
+    """SCRAPE_MODE = "summary": grid rows to SUMMARY_CSV, then optional enrichment."""
+    opened = open_search(driver, START_DATE, END_DATE)
+    if not opened or not opened[1]:
+        return
+    total_items, total_pages = opened
+    
+    writer = None
+    selected = []
+    try:
+        with metrics.stage("step_5"):
+            for summary in iter_grid_summaries(driver, total_pages):
+                if writer is None:
+                    # Columns come from the grid header on the first page
+                    writer = CsvRecordWriter(SUMMARY_CSV, headers=list(summary))
+                writer.write(summary)
+                if ENRICH_FILTER is not None and ENRICH_FILTER(summary):
+                    selected.append(summary)
+    finally:
+        if writer is not None:
+            writer.close()
+    
+    if writer is None:
+        print("❌ No grid rows collected")
+        return
+    print(f"📋 Summary: {writer.count}/{total_items} grid rows → {SUMMARY_CSV} "
+          f"({len(writer.headers)} columns)")
+    
+    if ENRICH_FILTER is None:
+        return
+    print(f"🔎 Enriching {len(selected)} of {writer.count} DAs matching ENRICH_FILTER")
+    with CsvRecordWriter(OUTPUT_CSV) as details, metrics.stage("step_6"):
+        enrich_summaries(
+            driver, selected,
+            on_record=lambda item, record: details.write(record),
+        )
+    details.print_summary()
+
+
+# ==================== INCREMENTAL: SKIP FINALIZED APPLICATIONS ====================
+
+def is_final_decision(record):
+    """True when the record's Decision matches FINAL_DECISION_RE."""
+    return bool(FINAL_DECISION_RE.match(record.get("Decision") or ""))
+
+
+def reuse_fresh_snapshots(store, key, items, writer=None):
+    """
+    Mark items whose stored record is final and recently checked as done,
+    reusing that record (also written through `writer` when given).
+    Returns the items that still need fetching, in order.
+    """
+    max_age = INCREMENTAL_MAX_AGE_DAYS * 24 * 3600
+    remaining = []
+    for item in items:
+        record = store.fresh_snapshot(item["da"], max_age)
+        if record is None:
+            remaining.append(item)
+            continue
+        store.mark_done(key, item["da"], record)
+        metrics.inc("records_reused")
+        if writer is not None:
+            writer.write(record)
+    return remaining
+
+
+def record_change(store, feed, record):
+    """
+    Update the DA's snapshot and append a change line to `feed` if it changed.
+    Returns the snapshot record, or None when a FIELDS run had no snapshot to
+    merge its columns into.
+    """
+    if FIELDS:
+        # A projected record only holds some columns: fold them into the full
+        # snapshot, and leave DAs without one for a full run to record.
+        # Decision is always parsed on incremental runs (required_sections),
+        # so finality is judged from this fetch, not the stored snapshot
+        fields = output_headers()
+        if "Decision" not in fields:
+            fields.append("Decision")
+        record = store.merge_snapshot(record["DA_Number"], record, fields)
+        if record is None:
+            metrics.inc("records_unsnapshotted")
+            return None
+    change = store.update_snapshot(record["DA_Number"], record, HEADERS, is_final_decision(record))
+    if change is None:
+        metrics.inc("records_unchanged")
+        return record
+    metrics.inc(f"records_{change['change']}")
+    if feed is not None:
+        entry = {
+            "da": record["DA_Number"],
+            "detail_url": record["Detail_URL"],
+            "at": datetime.now().isoformat(timespec="seconds"),
+        }
+        entry.update(change)
+        feed.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        feed.flush()
+    return record
+
+
+# ==================== STEP 7: SAVE TO CSV ====================
+
+# Columns counted in the "Data Quality" report
+QUALITY_FIELDS = [
+    ("DA_Number", "Non-empty DA_Numbers"),
+    ("Description", "Records with Description"),
+    ("Decision", "Records with Decision"),
+    ("Fees", "Fees (cleaned)"),
+    ("Contact_Council", "Contact_Council (cleaned)"),
+]
+
+
+class CsvRecordWriter:
+    """
+    Streaming CSV writer: appends each record in HEADERS order as it arrives
+    and keeps the Data Quality counters up to date, so memory stays flat.
+    Rows go to `<filename>.partial` and the file is renamed on close().
+    """
+
+    def __init__(self, filename, headers=None):
+        self.filename = filename
+        self.headers = headers or output_headers()
+        self.partial = filename + ".partial"
+        self.count = 0
+        self.non_empty = {field: 0 for field, _ in QUALITY_FIELDS}
+        
+        self.file = open(self.partial, "w", newline="", encoding="utf-8-sig")
+        self.writer = csv.DictWriter(self.file, fieldnames=self.headers, lineterminator=os.linesep)
+        self.writer.writeheader()
+
+    def write(self, record):
+        row = {header: record.get(header) or "" for header in self.headers}
+        self.writer.writerow(row)
+        self.count += 1
+        for field in self.non_empty:
+            if row.get(field, "") != "":
+                self.non_empty[field] += 1
+
+    def close(self):
+        if self.file.closed:
             return
+        self.file.close()
+        os.replace(self.partial, self.filename)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def print_summary(self):
+        """STEP 7 report: file, headers and Data Quality counts."""
+        print("\n" + "="*70)
+        print("STEP 7: Save to CSV")
+        print("="*70)
+        print(f"\n✅ CSV SAVED SUCCESSFULLY")
+        print(f"   File: {self.filename}")
+        print(f"   Total Records: {self.count}")
+        print(f"   Columns: {len(self.headers)}")
+        print(f"\n   Column Headers:")
+        for i, header in enumerate(self.headers, 1):
+            print(f"     {i:2d}. {header}")
+        
+        if self.count > 0:
+            print(f"\n   Data Quality:")
+            for field, label in QUALITY_FIELDS:
+                if field in self.headers:
+                    print(f"     {label}: {self.non_empty[field]}/{self.count}")
+
+
+def save_records_to_csv(records, filename):
+    """STEP 7: Save all records (any iterable) to CSV with exact 12 headers."""
+    try:
+        with CsvRecordWriter(filename) as writer:
+            for record in records:
+                writer.write(record)
+        writer.print_summary()
+        return True
+        
+    except Exception as e:
+        print(f"❌ FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def open_parquet_writer():
+    """ParquetRecordWriter for PARQUET_DIR, or None when disabled/pyarrow missing."""
+    if not PARQUET_DIR:
+        return None
+    try:
+        return ParquetRecordWriter(PARQUET_DIR, output_headers(), PARQUET_ROWS_PER_FILE)
+    except ImportError:
+        print("⚠️  PARQUET_DIR is set but pyarrow is not installed (pip install pyarrow)")
+        return None
+
+
+def open_query_store():
+    """QueryStore for QUERY_DB, or None when disabled."""
+    return QueryStore(QUERY_DB, fields=output_headers()) if QUERY_DB else None
+
+
+# ==================== BACKFILL: DATE-RANGE SHARDING ====================
+
+DATE_FORMAT = "%d/%m/%Y"
+
+
+def split_date_range(start_date, end_date, window="month"):
+    """
+    Split an inclusive dd/mm/yyyy range into contiguous, non-overlapping
+    windows: "week" (7 days), "month" (calendar months) or an int of days.
+    Returns [(start, end), ...] as dd/mm/yyyy strings.
+    """
+    start = datetime.strptime(start_date, DATE_FORMAT)
+    end = datetime.strptime(end_date, DATE_FORMAT)
+    
+    windows = []
+    while start <= end:
+        if window == "month":
+            next_start = (start.replace(day=1) + timedelta(days=32)).replace(day=1)
+        else:
+            days = 7 if window == "week" else int(window)
+            next_start = start + timedelta(days=days)
+        window_end = min(next_start - timedelta(days=1), end)
+        windows.append((start.strftime(DATE_FORMAT), window_end.strftime(DATE_FORMAT)))
+        start = next_start
+    
+    return windows
+
+
+def merge_da_url_lists(da_url_lists):
+    """
+    Merge per-window DA lists in window order, dropping DAs (or detail URLs)
+    already seen in an earlier window - searches on boundary dates can overlap.
+    """
+    merged = []
+    seen_das = set()
+    seen_urls = set()
+    for da_url_list in da_url_lists:
+        for item in da_url_list:
+            url = normalize_url(item["url"])
+            if item["da"] in seen_das or url in seen_urls:
+                continue
+            seen_das.add(item["da"])
+            seen_urls.add(url)
+            merged.append({"da": item["da"], "url": url})
+    return merged
+
+
+_BACKFILL_SLOT = None
+
+
+def _init_backfill_worker(slots):
+    """Process-pool initializer: claim a stable slot number for the profile name."""
+    global _BACKFILL_SLOT
+    with slots.get_lock():
+        _BACKFILL_SLOT = slots.value
+        slots.value += 1
+
+
+def _search_window(window):
+    """Process-pool task: one browser session searching and collecting one window."""
+    # Windows run in parallel, so each worker needs its own profile directory
+    driver = create_driver(headless=POOL_HEADLESS, profile=f"backfill-{_BACKFILL_SLOT}")
+    try:
+        return window, run_search(driver, *window)
+    finally:
+        driver.quit()
+
+
+def collect_backfill(start_date, end_date, window=None, workers=None):
+    """
+    Backfill collection: run STEPS 1-5 for every window in parallel sessions.
+    Returns (total_items, da_url_list, failed_windows); windows fail
+    independently and are reported rather than aborting the run.
+    """
+    window = window or BACKFILL_WINDOW or "month"
+    workers = workers or BACKFILL_WORKERS
+    windows = split_date_range(start_date, end_date, window)
+    
+    print("\n" + "="*70)
+    print(f"BACKFILL: {len(windows)} windows ({window}) with {workers} parallel sessions")
+    print("="*70)
+    
+    results = {}
+    failed_windows = []
+    ctx = mp.get_context("spawn")
+    slots = ctx.Value("i", 0)
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=ctx,
+        initializer=_init_backfill_worker, initargs=(slots,),
+    ) as pool:
+        futures = {pool.submit(_search_window, w): w for w in windows}
+        for future in as_completed(futures):
+            w = futures[future]
+            try:
+                _, search = future.result()
+            except Exception as e:
+                search = None
+                print(f"❌ Window {w[0]} → {w[1]}: {type(e).__name__}: {e}")
+            
+            if search is None:
+                failed_windows.append(w)
+                print(f"❌ Window {w[0]} → {w[1]} failed")
+            else:
+                results[w] = search
+                print(f"✅ Window {w[0]} → {w[1]}: {len(search[2])} DAs")
+    
+    total_items = sum(results[w][0] or 0 for w in results)
+    da_url_list = merge_da_url_lists(results[w][2] for w in windows if w in results)
+    
+    print(f"\n✅ Backfill collection: {len(da_url_list)} unique DAs "
+          f"from {len(results)}/{len(windows)} windows")
+    if failed_windows:
+        print("⚠️  Failed windows: " + ", ".join(f"{a} → {b}" for a, b in sorted(failed_windows)))
+    
+    return total_items, da_url_list, sorted(failed_windows)
+
+
+# ==================== MAIN EXECUTION ====================
+
+def run_steps(steps):
+    """Run (name, step) pairs in order, each as a metrics stage; False at the first failure."""
+    for name, step in steps:
+        with metrics.stage(name):
+            ok = step()
+        if not ok:
+            metrics.inc("step_failures")
+            return False
+    return True
+
+
+def open_advanced_search(driver, disclaimer_accepted=False):
+    """
+    STEPS 1-3: accept the disclaimer and open the Advanced Search panel.
+    With disclaimer_accepted the session just goes back to the start page.
+    """
+    step_1 = reload_start_page if disclaimer_accepted else step_1_accept_disclaimer
+    return run_steps([
+        ("step_1", lambda: step_1(driver)),
+        ("step_2", lambda: step_2_navigate_da_tracking(driver)),
+        ("step_3", lambda: step_3_open_advanced_search(driver)),
+    ])
+
+
+def open_search(driver, start_date, end_date):
+    """
+    STEPS 1-4: accept the disclaimer and search the date range, leaving the
+    results grid on screen. Returns (total_items, total_pages), or None if
+    any step failed. A search with no results returns (0, 0).
+    """
+    if not open_advanced_search(driver):
+        return None
+    return search_date_range(driver, start_date, end_date)
+
+
+def search_date_range(driver, start_date, end_date):
+    """
+    STEP 4 from an open Advanced Search panel; same results as open_search().
+    """
+    ok = run_steps([
+        ("step_4", lambda: step_4_set_date_range(driver, start_date, end_date)),
+        ("step_4b", lambda: step_4b_click_search(driver)),
+    ])
+    if not ok:
+        return None
+    
+    # Check for results
+    if "No records" in driver.page_source:
+        print("❌ No records found")
+        return 0, 0
+    
+    # Extract total pages
+    total_items, total_pages = extract_total_pages_and_items(driver)
+    
+    if total_pages is None:
+        print("❌ Could not extract total pages")
+        return None
+    
+    print(f"\n📊 Search Results Detected:")
+    print(f"   Total Items: {total_items}")
+    print(f"   Total Pages: {total_pages}\n")
+    return total_items, total_pages
+
+
+def run_search(driver, start_date, end_date):
+    """
+    STEPS 1-5: accept the disclaimer, search the date range and collect DA+URLs.
+    Returns (total_items, total_pages, da_url_list), or None if any step failed.
+    A search with no results returns (0, 0, []).
+    """
+    opened = open_search(driver, start_date, end_date)
+    if opened is None:
+        return None
+    total_items, total_pages = opened
+    if not total_pages:
+        return 0, 0, []
+    
+    da_url_list = collect_search_results(driver, total_pages)
+    if not da_url_list:
+        print("❌ No DA+URL pairs collected")
+        return None
+    
+    return total_items, total_pages, da_url_list
+
+
+def collect_search_results(driver, total_pages):
+    """STEP 5: DA+URL pairs from the results grid on screen, with COLLECTOR."""
+    da_url_list = []
+    with metrics.stage("step_5"):
+        if COLLECTOR == "postback":
+            da_url_list = collect_da_and_urls_postback(driver)
+            if not da_url_list:
+                print("⚠️  Falling back to browser pagination")
+        if not da_url_list:
+            da_url_list = collect_da_and_urls(driver, total_pages)
+    return da_url_list
+
+
+def export_metrics():
+    """Print the stage report and write METRICS_JSON / METRICS_PROM / profiles."""
+    metrics.print_report()
+    try:
+        if METRICS_JSON:
+            metrics.write_json(METRICS_JSON)
+            print(f"📈 Metrics summary: {METRICS_JSON}")
+        if METRICS_PROM:
+            metrics.write_prometheus(METRICS_PROM)
+            print(f"📈 Prometheus metrics: {METRICS_PROM}")
+        for path in metrics.dump_profiles():
+            print(f"🔬 Profile: {path}")
+    except OSError as e:
+        print(f"⚠️  Could not write metrics: {e}")
+
+
+def replay_main():
+    """Rebuild OUTPUT_CSV from cached detail pages only - no browser, no network."""
+    cache = open_page_cache()
+    print("\n" + "="*70)
+    print("🔁 REPLAY FROM PAGE CACHE")
+    print("="*70)
+    if cache is None:
+        print("❌ PAGE_CACHE_DIR is not set")
+        return
+    
+    entries, size = cache.stats()
+    print(f"📦 Cache: {PAGE_CACHE_DIR} ({entries} pages, {size / 1024 ** 2:.1f} MB)")
+    print(f"📂 Output File: {OUTPUT_CSV}")
+    save_records_to_csv(replay_records_from_cache(cache), OUTPUT_CSV)
+    export_metrics()
+
+
+def main():
+    """Main execution - All 7 Steps."""
+    metrics.configure_profiling(PROFILE_STAGES, PROFILE_DIR)
+    if REPLAY_FROM_CACHE:
+        replay_main()
+        return
+    
+    driver = create_driver()
+    if SCRAPE_MODE == "summary":
+        try:
+            summary_main(driver)
+            export_metrics()
+        finally:
+            driver.quit()
+        return
+    
+    store = JobStore(JOB_STORE_PATH) if JOB_STORE_PATH else None
+    key = range_key(START_DATE, END_DATE)
+    
+    try:
+        print("\n" + "="*70)
+        print("🚀 SHOALHAVEN DA TRACKING SCRAPER - FINAL COMPLETE")
+        print("="*70)
+        print(f"📅 Date Range: {START_DATE} to {END_DATE}")
+        print(f"📂 Output File: {OUTPUT_CSV}")
+        print(f"✨ Features:")
+        print(f"   • URL normalization (relative → absolute)")
+        print(f"   • Sequential scraping (no duplicates)")
+        print(f"   • Detail engine: {DETAIL_ENGINE}")
+        print(f"   • Exact cleaning rules applied")
+        print(f"   • {len(output_headers())}-column CSV output")
+        if store:
+            print(f"   • Checkpointing to {JOB_STORE_PATH}")
+        print("="*70 + "\n")
+        
+        incremental = INCREMENTAL and store is not None
+        if INCREMENTAL and store is None:
+            print("⚠️  INCREMENTAL needs JOB_STORE_PATH; fetching every DA")
         
-        # STEP 6: Scrape all records
-        all_records = scrape_all_records(driver, da_url_list)
+        if store and store.is_collected(key) and not incremental:
+            # Resume: the DA list is already saved, only the session is needed
+            total_items, total_pages = store.run_totals(key)
+            counts = store.status_counts(key)
+            print(f"♻️  Resuming {key}: {counts['done']} done, "
+                  f"{counts['pending']} pending, {counts['failed']} failed")
+            step_1_accept_disclaimer(driver)
+            da_url_list = store.pending(key)
+        elif PIPELINE and not BACKFILL_WINDOW:
+            # STEP 5 runs inside the pipeline below, overlapped with STEP 6
+            opened = open_search(driver, START_DATE, END_DATE)
+            if not opened or not opened[1]:
+                return
+            total_items, total_pages = opened
+            da_url_list = None
+            if incremental:
+                # Every DA is checked again; fresh final snapshots are reused per page
+                store.requeue(key)
+        else:
+            complete = True
+            if BACKFILL_WINDOW:
+                total_items, da_url_list, failed_windows = collect_backfill(START_DATE, END_DATE)
+                total_pages = None
+                complete = not failed_windows
+                # Detail pages only need the disclaimer session
+                step_1_accept_disclaimer(driver)
+            else:
+                search = run_search(driver, START_DATE, END_DATE)
+                if search is None:
+                    return
+                total_items, total_pages, da_url_list = search
+            
+            if not da_url_list:
+                return
+            if store:
+                # A range with failed windows is searched again on the next run
+                store.save_urls(key, da_url_list, total_items, total_pages, complete=complete)
+                if incremental:
+                    # Every DA is checked again; fresh_snapshot() picks the ones to skip
+                    store.requeue(key)
+                da_url_list = store.pending(key)
+        
+        if incremental and da_url_list is not None:
+            # Finalized, recently checked DAs are served from their snapshot
+            before = len(da_url_list)
+            da_url_list = reuse_fresh_snapshots(store, key, da_url_list)
+            print(f"♻️  Incremental: {before - len(da_url_list)} finalized DAs reused, "
+                  f"{len(da_url_list)} to fetch")
+        
+        # STEPS 6-7: Scrape all records, checkpointing and streaming each
+        # one to the CSV as it arrives
+        writer = CsvRecordWriter(OUTPUT_CSV)
+        # Parquet only gets this run's records; earlier runs already appended theirs
+        parquet = open_parquet_writer()
+        query_db = open_query_store()
+        downloader = open_document_downloader(driver)
+        if store:
+            # Records finished by earlier runs of this range come first;
+            # their documents are re-queued so earlier failures are retried
+            for record in store.records(key):
+                writer.write(record)
+                if downloader is not None:
+                    downloader.submit(record["DA_Number"], record.get("Document_Links") or [])
+        
+        change_feed = open(CHANGE_FEED, "a", encoding="utf-8") if incremental and CHANGE_FEED else None
+        
+        def on_record(item, record):
+            saved = record
+            if incremental:
+                saved = record_change(store, change_feed, record) or record
+            if store:
+                store.mark_done(key, item["da"], saved)
+            writer.write(record)
+            if parquet is not None:
+                parquet.write(record)
+            if query_db is not None:
+                query_db.write(record)
+            if downloader is not None:
+                downloader.submit(item["da"], record.get("Document_Links") or [])
         
-        if not all_records:
+        def on_failure(item, error):
+            if store:
+                store.mark_failed(key, item["da"], error)
+        
+        saved = 0
+        skip_das = store.done_das(key) if store else set()
+        
+        def on_page(page_items):
+            # Pipeline: checkpoint each grid page before its DAs are fetched
+            nonlocal saved
+            if store:
+                store.save_urls(key, page_items, total_items, total_pages,
+                                complete=False, start_position=saved)
+            if incremental:
+                candidates = [item for item in page_items if item["da"] not in skip_das]
+                remaining = {item["da"] for item in reuse_fresh_snapshots(store, key, candidates, writer)}
+                skip_das.update(item["da"] for item in candidates if item["da"] not in remaining)
+            saved += len(page_items)
+        
+        try:
+            with writer, metrics.stage("step_6"):
+                if da_url_list is None:
+                    scrape_pipelined(
+                        driver, total_items, total_pages,
+                        on_record=on_record, on_failure=on_failure, on_page=on_page,
+                        skip_das=skip_das,
+                    )
+                    if store:
+                        # Collected in full: the next run resumes instead of searching
+                        store.save_urls(key, [], total_items, total_pages,
+                                        complete=saved >= (total_items or 0))
+                    da_url_list = ()
+                else:
+                    scrape_all_records(
+                        driver, da_url_list,
+                        on_record=on_record, on_failure=on_failure, keep_records=False,
+                    )
+        finally:
+            metrics.inc("records_written", writer.count)
+            if change_feed is not None:
+                change_feed.close()
+            if parquet is not None:
+                parquet.close()
+                print(f"🗂️  Parquet: {parquet.count} records in {len(parquet.files)} "
+                      f"new file(s) under {PARQUET_DIR}")
+            if query_db is not None:
+                query_db.close()
+                print(f"🗄️  Query store: {query_db.count} records upserted into {QUERY_DB}")
+            if downloader is not None:
+                print("📎 Waiting for document downloads...")
+                downloader.close()
+                downloader.session.close()
+                print(f"📎 Documents: {downloader.downloaded} downloaded "
+                      f"({downloader.bytes / 1024 ** 2:.1f} MB, {downloader.duplicates} duplicate content), "
+                      f"{downloader.skipped} already stored, {downloader.failed} failed → {DOCUMENTS_DIR}")
+        
+        if writer.count == 0:
             print("❌ No records extracted")
             return
         
-        # STEP 7: Save to CSV
-        save_records_to_csv(all_records, OUTPUT_CSV)
+        writer.print_summary()
         
         # Summary
         print("\n" + "="*70)
         print("✅ SCRAPING COMPLETE - SUCCESS")
         print("="*70)
         print(f"   Expected Records: {total_items}")
-        print(f"   Actual Records: {len(all_records)}")
-        print(f"   Success Rate: {(len(all_records)/total_items)*100:.1f}%")
-        print(f"   DA+URLs Collected: {len(da_url_list)}")
+        print(f"   Actual Records: {writer.count}")
+        if total_items:
+            print(f"   Success Rate: {(writer.count/total_items)*100:.1f}%")
+        print(f"   DA+URLs Scraped This Run: {len(da_url_list) or saved}")
         print(f"   Pages Processed: {total_pages}")
+        if store:
+            counts = store.status_counts(key)
+            print(f"   Checkpoint: {counts['done']} done, {counts['failed']} failed "
+                  f"(rerun to retry failures)")
         print(f"   Duplicates Prevented: ✅")
         print(f"   Data Cleaning: Applied ✅")
-        print(f"   CSV Format: 12 exact headers ✅")
+        print(f"   CSV Format: {len(writer.headers)} exact headers ✅")
         print("="*70 + "\n")
         
+        print_wait_report()
+        
     except Exception as e:
         print(f"\n❌ FATAL ERROR: {e}")
         import traceback
         traceback.print_exc()
         
     finally:
+        if store:
+            store.close()
+        cache = open_page_cache()
+        if cache is not None:
+            removed = cache.evict()
+            if removed:
+                print(f"🧹 Evicted {removed} cached pages")
+        export_metrics()
         driver.quit()
         print("✅ WebDriver closed\n")
 